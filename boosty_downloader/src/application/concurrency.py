@@ -0,0 +1,83 @@
+"""Helpers to run independent download steps concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable
+
+T = TypeVar('T')
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """
+    Await all the awaitables concurrently and return their results in order.
+
+    Unlike plain `asyncio.gather`, the first failure cancels the remaining
+    awaitables and waits for them to clean up (e.g. remove partial files)
+    before the error is re-raised, so nothing keeps downloading in the background.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@dataclass(slots=True)
+class _ProducerFailed:
+    error: Exception
+
+
+_EXHAUSTED = object()
+
+
+async def prefetch(source: AsyncIterator[T], size: int = 1) -> AsyncIterator[T]:
+    """
+    Iterate over the source while a background task already fetches the next items.
+
+    Up to `size` items are fetched ahead, so slow producers (e.g. paginated
+    API requests with delays) overlap with processing of the current item.
+    Errors of the source are re-raised to the consumer in order.
+
+    Iterate inside `contextlib.aclosing`: the background task only stops
+    once the generator is closed, not when the consumer stops iterating.
+    """
+    # Each slot is one item fetched ahead: it is taken before fetching and
+    # given back when the consumer takes the item, so the lookahead is exact.
+    free_slots = asyncio.Semaphore(size)
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            while True:
+                await free_slots.acquire()
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    break
+                queue.put_nowait(item)
+        # Not swallowed: handed over to the consumer and re-raised there.
+        except Exception as e:  # noqa: BLE001
+            queue.put_nowait(_ProducerFailed(e))
+        else:
+            queue.put_nowait(_EXHAUSTED)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (item := await queue.get()) is not _EXHAUSTED:
+            free_slots.release()
+            if isinstance(item, _ProducerFailed):
+                raise item.error
+            yield cast('T', item)
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
@@ -66,9 +66,22 @@ class AppEnvironment:
             # Don't: set BASE_URL here, the BoostyAPIClient will handle it internally.
             # Why: this session will be used for both downloading and API requests with different bases.
             aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    # Posts and their chunks download concurrently, mostly
+                    # from a few CDN hosts: keep enough connections alive
+                    # there to reuse instead of new TCP+TLS handshakes.
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
                 headers=self.boosty_headers,
                 cookie_jar=self.boosty_cookies_jar,
-                timeout=aiohttp.ClientTimeout(total=None),
+                # No total limit (videos take long), but a stalled
+                # connection fails and gets retried instead of hanging forever.
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=30, sock_read=60
+                ),
                 trust_env=True,
             )
         )
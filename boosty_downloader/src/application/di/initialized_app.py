@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import importlib.metadata
 from contextlib import asynccontextmanager
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 import aiohttp
-from aiohttp_retry import ExponentialRetry
+from aiohttp_retry import JitterRetry
 
 from boosty_downloader.src.application.di.app_environment import AppEnvironment
 from boosty_downloader.src.infrastructure.boosty_api.utils.auth_parsers import (
@@ -53,6 +54,12 @@ def _check_and_log_updates() -> None:
             )
 
 
+def _warn_skipped_cookie(name: str) -> None:
+    logger_instances.downloader_logger.warning(
+        f'Skipped cookie with unsupported name: {name}'
+    )
+
+
 @asynccontextmanager
 async def initialized_app(
     *,
@@ -70,8 +77,15 @@ async def initialized_app(
     if cache_directory is not None:
         config.downloading_settings.cache_directory = cache_directory
 
-    retry_options = ExponentialRetry(
+    # Server errors are retried by default; 429 is added on top. Waits grow
+    # 2s, 4s, 8s, 16s plus up to 1s of jitter, so an outage or a rate limit
+    # is not hammered with back-to-back retries.
+    retry_options = JitterRetry(
         attempts=5,
+        start_timeout=1,
+        factor=2,
+        random_interval_size=1,
+        statuses={HTTPStatus.TOO_MANY_REQUESTS},
         exceptions={
             aiohttp.ClientConnectorError,
             aiohttp.ClientOSError,
@@ -91,7 +105,9 @@ async def initialized_app(
             if config.downloading_settings.cache_directory
             else None,
             boosty_headers=parse_auth_header(config.auth.auth_header),
-            boosty_cookies_jar=parse_session_cookie(config.auth.cookie),
+            boosty_cookies_jar=parse_session_cookie(
+                config.auth.cookie, on_skipped_cookie=_warn_skipped_cookie
+            ),
             retry_options=retry_options,
             request_delay_seconds=request_delay_seconds,
             logger=logger_instances.downloader_logger,
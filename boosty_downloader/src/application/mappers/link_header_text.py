@@ -4,7 +4,7 @@ Mapper for converting textual Boosty API post data chunks to domain text object.
 If the API responses change, this mapper may need to be updated accordingly.
 """
 
-import json
+from pydantic_core import from_json
 
 from boosty_downloader.src.domain.post_data_chunks import PostDataChunkText
 from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types import (
@@ -115,11 +115,12 @@ def _parse_content_field(
         - you can read about them in the _parse_style_array and _parse_header functions above.
         """
         try:
-            parsed = json.loads(content)
+            # pydantic's Rust parser: several times faster than json.loads here
+            parsed = from_json(content)
             text = parsed[0]
             style_info = parsed[1]
             style_array = parsed[2]
-        except json.JSONDecodeError:
+        except ValueError:
             return content, '', []
         else:
             return text, style_info, style_array
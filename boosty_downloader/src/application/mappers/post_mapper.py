@@ -23,10 +23,6 @@ from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types
     BoostyPostDataTextDTO,
     BoostyPostDataUnknownDTO,
 )
-from boosty_downloader.src.infrastructure.boosty_api.models.unknown_content import (
-    UnknownContent,
-    collect_unknown_content,
-)
 
 if TYPE_CHECKING:
     from boosty_downloader.src.infrastructure.boosty_api.models.post.post import (
@@ -37,7 +33,7 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PostMappingResult:
     """Result of mapping a PostDTO to a domain Post, including info about incomplete content."""
 
@@ -45,11 +41,7 @@ class PostMappingResult:
     incomplete_content_types: set[DownloadContentTypeFilter] = field(
         default_factory=lambda: set[DownloadContentTypeFilter]()
     )
-    # Content this client doesn't know yet, raw. Rendering it for the user
-    # is the output layer's job (inline warnings and the run summary).
-    unknown_content: set[UnknownContent] = field(
-        default_factory=lambda: set[UnknownContent]()
-    )
+    unplayable_videos: int = 0
 
 
 def map_post_dto_to_domain(  # noqa: C901
@@ -67,9 +59,7 @@ def map_post_dto_to_domain(  # noqa: C901
     )
 
     incomplete_content_types: set[DownloadContentTypeFilter] = set()
-    # One type-driven walk over the whole parsed post: any tolerant field
-    # or unknown chunk is reported automatically, wherever it sits.
-    unknown_content = collect_unknown_content(post_dto)
+    unplayable_videos = 0
 
     for data_chunk in post_dto.data:
         match data_chunk:
@@ -98,8 +88,10 @@ def map_post_dto_to_domain(  # noqa: C901
                 video_chunk = mappers.to_ok_boosty_video_content(
                     data_chunk, preferred_quality=preferred_video_quality
                 )
-                if video_chunk is not None:
-                    post.post_data_chunks.append(video_chunk)
+                if video_chunk is None:
+                    unplayable_videos += 1
+                    continue
+                post.post_data_chunks.append(video_chunk)
             case BoostyPostDataExternalVideoDTO():
                 post.post_data_chunks.append(
                     mappers.to_external_video_content(data_chunk)
@@ -110,11 +102,12 @@ def map_post_dto_to_domain(  # noqa: C901
                     continue
                 post.post_data_chunks.append(mappers.to_domain_audio_chunk(data_chunk))
             case BoostyPostDataUnknownDTO():
-                # Reported by collect_unknown_content; nothing to map here.
+                # The use cases report it via collect_unknown_content,
+                # which walks each post once; nothing to map here.
                 pass
 
     return PostMappingResult(
         post=post,
         incomplete_content_types=incomplete_content_types,
-        unknown_content=unknown_content,
+        unplayable_videos=unplayable_videos,
     )
@@ -50,26 +50,33 @@ class RankingDict(Generic[KT]):
         return None
 
 
+# Higher rank wins; built once at import instead of on every video.
+_QUALITY_RANK: dict[BoostyOkVideoType, int] = {
+    BoostyOkVideoType.ultra_hd: 17,
+    BoostyOkVideoType.quad_hd: 16,
+    BoostyOkVideoType.full_hd: 15,
+    BoostyOkVideoType.high: 14,
+    BoostyOkVideoType.medium: 13,
+    BoostyOkVideoType.low: 12,
+    BoostyOkVideoType.tiny: 11,
+    BoostyOkVideoType.lowest: 10,
+    BoostyOkVideoType.live_playback_dash: 9,
+    BoostyOkVideoType.live_playback_hls: 8,
+    BoostyOkVideoType.live_ondemand_hls: 7,
+    BoostyOkVideoType.live_dash: 6,
+    BoostyOkVideoType.live_hls: 5,
+    BoostyOkVideoType.hls: 4,
+    BoostyOkVideoType.dash: 3,
+    BoostyOkVideoType.dash_uni: 2,
+    BoostyOkVideoType.live_cmaf: 1,
+}
+
+
 def get_quality_ranking() -> RankingDict[BoostyOkVideoType]:
     """Get the ranking dict for video quality"""
     quality_ranking = RankingDict[BoostyOkVideoType]()
-    quality_ranking[BoostyOkVideoType.ultra_hd] = 17
-    quality_ranking[BoostyOkVideoType.quad_hd] = 16
-    quality_ranking[BoostyOkVideoType.full_hd] = 15
-    quality_ranking[BoostyOkVideoType.high] = 14
-    quality_ranking[BoostyOkVideoType.medium] = 13
-    quality_ranking[BoostyOkVideoType.low] = 12
-    quality_ranking[BoostyOkVideoType.tiny] = 11
-    quality_ranking[BoostyOkVideoType.lowest] = 10
-    quality_ranking[BoostyOkVideoType.live_playback_dash] = 9
-    quality_ranking[BoostyOkVideoType.live_playback_hls] = 8
-    quality_ranking[BoostyOkVideoType.live_ondemand_hls] = 7
-    quality_ranking[BoostyOkVideoType.live_dash] = 6
-    quality_ranking[BoostyOkVideoType.live_hls] = 5
-    quality_ranking[BoostyOkVideoType.hls] = 4
-    quality_ranking[BoostyOkVideoType.dash] = 3
-    quality_ranking[BoostyOkVideoType.dash_uni] = 2
-    quality_ranking[BoostyOkVideoType.live_cmaf] = 1
+    for video_type, rank in _QUALITY_RANK.items():
+        quality_ranking[video_type] = rank
 
     return quality_ranking
 
@@ -79,16 +86,18 @@ def get_best_video(
     preferred_quality: BoostyOkVideoType = BoostyOkVideoType.medium,
 ) -> tuple[BoostyOkVideoUrl, BoostyOkVideoType] | None:
     """Select the best video format for downloading according to user's preferences"""
-    quality_ranking: RankingDict[BoostyOkVideoType] = get_quality_ranking()
-    quality_ranking[preferred_quality] = float('inf')
-
     video_urls_map = {video.type: video for video in video_urls}
 
-    while highest_rank_video_type := quality_ranking.pop_max():
-        highest_rank_video_type = highest_rank_video_type[0]
+    best: tuple[BoostyOkVideoUrl, BoostyOkVideoType] | None = None
+    best_rank = float('-inf')
+    for video_type, video_url in video_urls_map.items():
+        if not video_url.url or not isinstance(video_type, BoostyOkVideoType):
+            continue
+        if video_type == preferred_quality:
+            return video_url, video_type
 
-        video_url = video_urls_map.get(highest_rank_video_type)
-        if video_url and video_url.url:
-            return video_url, highest_rank_video_type
+        rank = _QUALITY_RANK.get(video_type)
+        if rank is not None and rank > best_rank:
+            best, best_rank = (video_url, video_type), rank
 
-    return None
+    return best
@@ -0,0 +1,18 @@
+"""Names under which posts are saved on disk."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from boosty_downloader.src.infrastructure.path_sanitizer import sanitize_string
+
+if TYPE_CHECKING:
+    from boosty_downloader.src.infrastructure.boosty_api.models.post.post import (
+        PostDTO,
+    )
+
+
+def sanitized_post_title(post_dto: PostDTO) -> str:
+    """Return the post title safe for paths, empty titles fall back to the post ID."""
+    title = post_dto.title or f'No title (id_{post_dto.id[:8]})'
+    return sanitize_string(title).replace('.', '').strip()
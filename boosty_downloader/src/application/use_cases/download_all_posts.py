@@ -1,14 +1,17 @@
 """Implements the use case for downloading all posts from a Boosty author, applying filters and caching as needed."""
 
 import asyncio
+from contextlib import aclosing
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from boosty_downloader.src.application.concurrency import gather_or_cancel, prefetch
 from boosty_downloader.src.application.di.download_context import DownloadContext
 from boosty_downloader.src.application.exceptions.application_errors import (
     ApplicationCancelledError,
     ApplicationFailedDownloadError,
 )
+from boosty_downloader.src.application.post_naming import sanitized_post_title
 from boosty_downloader.src.application.use_cases.download_single_post import (
     DownloadSinglePostUseCase,
 )
@@ -21,16 +24,22 @@ from boosty_downloader.src.infrastructure.boosty_api.utils.validation_errors imp
     format_run_summary,
     format_skipped_post,
 )
-from boosty_downloader.src.infrastructure.path_sanitizer import (
-    sanitize_string,
-)
 
 if TYPE_CHECKING:
+    import uuid
+
+    from boosty_downloader.src.infrastructure.boosty_api.models.post.post import (
+        PostDTO,
+    )
     from boosty_downloader.src.infrastructure.boosty_api.models.post.posts_request import (
         PostsResponse,
         SkippedPost,
     )
 
+# Posts of a page are downloaded at the same time, each one with concurrent
+# chunks of its own. Bounded to keep memory and open connections in check.
+_CONCURRENT_POSTS = 4
+
 
 class DownloadAllPostUseCase:
     """
@@ -55,6 +64,8 @@ class DownloadAllPostUseCase:
         self.destination = destination
         self.context = download_context
 
+        self._posts_semaphore = asyncio.Semaphore(_CONCURRENT_POSTS)
+
     def _note_page_anomalies(
         self,
         page: 'PostsResponse',
@@ -68,84 +79,101 @@ class DownloadAllPostUseCase:
         for skipped in page.skipped_posts:
             self.context.progress_reporter.warn(format_skipped_post(skipped))
 
-    async def execute(self) -> None:
-        posts_iterator = self.boosty_api.iterate_over_posts(
-            author_name=self.author_name
-        )
+    async def _download_post(
+        self,
+        post_dto: 'PostDTO',
+        page_task_id: 'uuid.UUID',
+        current_page: int,
+    ) -> None:
+        """Download one post of a page, retrying it a few times on failures."""
+        async with self._posts_semaphore:
+            if not post_dto.has_access:
+                self.context.progress_reporter.warn(
+                    f'Skip post ([red]no access to content[/red]): {post_dto.title}'
+                )
+                return
 
-        current_page = 0
-        all_skipped: list[SkippedPost] = []
-        unknown_content: set[UnknownContent] = set()
+            post_dto.title = sanitized_post_title(post_dto)
 
-        async for page in posts_iterator:
-            count = len(page.posts)
-            current_page += 1
+            # date - TITLE (UUID_PART) for deduplication in case of same names with different posts
+            full_post_title = (
+                f'{post_dto.created_at.date()} - {post_dto.title} ({post_dto.id[:8]})'
+            )
 
-            self._note_page_anomalies(page, all_skipped, unknown_content)
+            single_post_use_case = DownloadSinglePostUseCase(
+                destination=self.destination / full_post_title,
+                post_dto=post_dto,
+                download_context=self.context,
+            )
 
-            page_task_id = self.context.progress_reporter.create_task(
-                f'Got new posts: [{count}]',
-                total=count,
-                indent_level=0,  # Each page prints without indentation
+            self.context.progress_reporter.update_task(
+                page_task_id,
+                advance=1,
+                description=f'Processing page [bold]{current_page}[/bold]',
             )
 
-            for post_dto in page.posts:
-                if not post_dto.has_access:
-                    self.context.progress_reporter.warn(
-                        f'Skip post ([red]no access to content[/red]): {post_dto.title}'
-                    )
-                    continue
+            max_attempts = 5
+            delay = 1.0
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    await single_post_use_case.execute()
+                    break
+                except ApplicationCancelledError:
+                    raise
+                except ApplicationFailedDownloadError as e:
+                    if attempt == max_attempts:
+                        self.context.progress_reporter.error(
+                            f'Skip post after {attempt} failed attempts: {full_post_title} ({e.message})'
+                        )
+                    else:
+                        self.context.progress_reporter.warn(
+                            f'Attempt {attempt} failed for post: {full_post_title} ({e.message}), RESOURCE: ({e.resource})'
+                        )
+                        self.context.progress_reporter.warn(
+                            f'Retrying in {delay:.1f}s... ({e.message})'
+                        )
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 1.5, 10.0)
 
-                # For empty titles use post ID as a fallback (first 8 chars)
-                if len(post_dto.title) == 0:
-                    post_dto.title = f'No title (id_{post_dto.id[:8]})'
+    async def execute(self) -> None:
+        current_page = 0
+        all_skipped: list[SkippedPost] = []
+        unknown_content: set[UnknownContent] = set()
 
-                post_dto.title = (
-                    sanitize_string(post_dto.title).replace('.', '').strip()
+        # The next page is requested while the current one is downloading.
+        # aclosing stops that request as soon as the loop is left (e.g. on
+        # an error or cancellation) instead of whenever the generator is GC'd.
+        async with aclosing(
+            prefetch(self.boosty_api.iterate_over_posts(author_name=self.author_name))
+        ) as pages:
+            async for page in pages:
+                count = len(page.posts)
+                current_page += 1
+
+                self._note_page_anomalies(page, all_skipped, unknown_content)
+                self.context.post_cache.prefetch([post.id for post in page.posts])
+
+                page_task_id = self.context.progress_reporter.create_task(
+                    f'Got new posts: [{count}]',
+                    total=count,
+                    indent_level=0,  # Each page prints without indentation
                 )
 
-                # date - TITLE (UUID_PART) for deduplication in case of same names with different posts
-                full_post_title = f'{post_dto.created_at.date()} - {post_dto.title} ({post_dto.id[:8]})'
-
-                single_post_use_case = DownloadSinglePostUseCase(
-                    destination=self.destination / full_post_title,
-                    post_dto=post_dto,
-                    download_context=self.context,
+                await gather_or_cancel(
+                    *(
+                        self._download_post(post_dto, page_task_id, current_page)
+                        for post_dto in page.posts
+                    )
                 )
 
-                self.context.progress_reporter.update_task(
-                    page_task_id,
-                    advance=1,
-                    description=f'Processing page [bold]{current_page}[/bold]',
-                )
+                # One commit per page instead of per post: each commit is an fsync.
+                # Whatever is left uncommitted is saved when the cache is closed.
+                self.context.post_cache.commit()
 
-                max_attempts = 5
-                delay = 1.0
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        await single_post_use_case.execute()
-                        break
-                    except ApplicationCancelledError:
-                        raise
-                    except ApplicationFailedDownloadError as e:
-                        if attempt == max_attempts:
-                            self.context.progress_reporter.error(
-                                f'Skip post after {attempt} failed attempts: {full_post_title} ({e.message})'
-                            )
-                        else:
-                            self.context.progress_reporter.warn(
-                                f'Attempt {attempt} failed for post: {full_post_title} ({e.message}), RESOURCE: ({e.resource})'
-                            )
-                            self.context.progress_reporter.warn(
-                                f'Retrying in {delay:.1f}s... ({e.message})'
-                            )
-                            await asyncio.sleep(delay)
-                            delay = min(delay * 1.5, 10.0)
-
-            self.context.progress_reporter.complete_task(page_task_id)
-            self.context.progress_reporter.success(
-                f'--- Finished page {current_page} ---'
-            )
+                self.context.progress_reporter.complete_task(page_task_id)
+                self.context.progress_reporter.success(
+                    f'--- Finished page {current_page} ---'
+                )
 
         summary = format_run_summary(all_skipped, unknown_content)
         if summary:
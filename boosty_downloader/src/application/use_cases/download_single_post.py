@@ -4,12 +4,17 @@ Use case for downloading a single post from Boosty.
 It encapsulates the logic required to download a post from a specific author.
 """
 
+import asyncio
+import contextlib
+import threading
+import time
 import uuid
 from asyncio import CancelledError
 from pathlib import Path
 
 from yarl import URL
 
+from boosty_downloader.src.application.concurrency import gather_or_cancel
 from boosty_downloader.src.application.di.download_context import DownloadContext
 from boosty_downloader.src.application.exceptions.application_errors import (
     ApplicationCancelledError,
@@ -29,6 +34,7 @@ from boosty_downloader.src.application.mappers.html_converter import (
     convert_text_to_html,
     convert_video_to_html,
 )
+from boosty_downloader.src.cli.console_progress_reporter import ProgressReporter
 from boosty_downloader.src.domain.post import (
     Post,
     PostDataAllChunks,
@@ -71,6 +77,117 @@ def _form_post_url(username: str, post_id: str) -> str:
     return f'https://boosty.to/{username}/posts/{post_id}'
 
 
+# Which filter each kind of chunk belongs to.
+_CHUNK_FILTERS: dict[type, DownloadContentTypeFilter] = {
+    PostDataChunkAudio: DownloadContentTypeFilter.audio,
+    PostDataChunkBoostyVideo: DownloadContentTypeFilter.boosty_videos,
+    PostDataChunkExternalVideo: DownloadContentTypeFilter.external_videos,
+    PostDataChunkFile: DownloadContentTypeFilter.files,
+    PostDataChunkText: DownloadContentTypeFilter.post_content,
+    PostDataChunkTextualList: DownloadContentTypeFilter.post_content,
+    PostDataChunkImage: DownloadContentTypeFilter.post_content,
+}
+
+# Progress bars can't be read faster than this anyway, while downloads report
+# every received chunk: skip redrawing in between (seconds).
+_PROGRESS_UPDATE_INTERVAL = 0.1
+
+# How many chunks of each kind of a post are downloaded at the same time.
+# Small images and files benefit the most, big videos would only compete
+# for bandwidth. Kinds missing here (text, lists) don't do any I/O.
+_CONCURRENT_CHUNKS_PER_KIND: dict[type, int] = {
+    PostDataChunkImage: 8,
+    PostDataChunkFile: 8,
+    PostDataChunkAudio: 4,
+    PostDataChunkBoostyVideo: 3,
+    PostDataChunkExternalVideo: 1,
+}
+
+
+class _DownloadProgress:
+    """
+    Forward download status to its progress task, throttled to _PROGRESS_UPDATE_INTERVAL.
+
+    One instance per download, pass the method matching the downloader as its callback.
+    """
+
+    __slots__ = (
+        '_downloaded',
+        '_label',
+        '_last_update',
+        '_pending_bytes',
+        '_reporter',
+        '_suffix',
+        '_task_id',
+        '_total',
+        '_total_text',
+    )
+
+    def __init__(
+        self,
+        reporter: ProgressReporter,
+        task_id: uuid.UUID,
+        label: str,
+        suffix: str = '',
+    ) -> None:
+        self._reporter = reporter
+        self._task_id = task_id
+        self._label = label
+        self._suffix = suffix
+        self._last_update = 0.0
+        self._pending_bytes = 0
+        self._downloaded: int | None = None
+        # The total rarely changes during a download: format it only then
+        self._total: int | None = None
+        self._total_text = human_readable_size(None)
+
+    def on_file_status(self, status: DownloadingStatus) -> None:
+        self._report(
+            advance=status.downloaded_bytes,
+            downloaded=status.total_downloaded_bytes,
+            total=status.total_bytes,
+        )
+
+    def on_external_video_status(self, status: ExternalVideoDownloadStatus) -> None:
+        self._report(
+            advance=status.delta_bytes,
+            downloaded=status.downloaded_bytes,
+            total=status.total_bytes,
+        )
+
+    def _report(self, advance: int, downloaded: int | None, total: int | None) -> None:
+        self._pending_bytes += advance
+        self._downloaded = downloaded
+        if total != self._total:
+            self._total = total
+            self._total_text = human_readable_size(total)
+
+        now = time.monotonic()
+        is_finished = total is not None and downloaded == total
+        if now - self._last_update < _PROGRESS_UPDATE_INTERVAL and not is_finished:
+            return
+        self._last_update = now
+        self._send()
+
+    def flush(self) -> None:
+        """Report the bytes held back by the throttle, call once the download is done."""
+        # Without a known total, _report can't tell the last update apart
+        if self._pending_bytes:
+            self._send()
+
+    def _send(self) -> None:
+        self._reporter.update_task(
+            self._task_id,
+            advance=self._pending_bytes,
+            total=self._total,
+            description=(
+                f'{self._label} [{human_readable_size(self._downloaded)}'
+                f' / {self._total_text}]{self._suffix}'
+            ),
+        )
+        self._pending_bytes = 0
+
+
 class DownloadSinglePostUseCase:
     """
     Use case for downloading all user's posts.
@@ -91,29 +208,29 @@ class DownloadSinglePostUseCase:
         self.post_dto = post_dto
         self.context = download_context
 
-        self.post_file_path = destination / Path('post.html')
-        self.images_destination = destination / Path('images')
-        self.files_destination = destination / Path('files')
-        self.external_videos_destination = destination / Path('external_videos')
-        self.boosty_videos_destination = destination / Path('boosty_videos')
-        self.audio_destination = destination / Path('audio')
+        self.post_file_path = destination / 'post.html'
+        self.images_destination = destination / 'images'
+        self.files_destination = destination / 'files'
+        self.external_videos_destination = destination / 'external_videos'
+        self.boosty_videos_destination = destination / 'boosty_videos'
+        self.audio_destination = destination / 'audio'
+
+        # Directories already created by this use case: a post with dozens of
+        # images would otherwise repeat the same mkdir syscall for each one.
+        self._ensured_directories: set[Path] = set()
+        self._file_locks: dict[Path, asyncio.Lock] = {}
+
+    def _ensure_directory(self, directory: Path) -> None:
+        if directory not in self._ensured_directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_directories.add(directory)
 
     def _should_execute(
         self, post: Post, missing_parts: list[DownloadContentTypeFilter]
     ) -> bool:
         """Check if the post has any content matching the requested filters."""
-        chunk_to_filter: dict[type, DownloadContentTypeFilter] = {
-            PostDataChunkAudio: DownloadContentTypeFilter.audio,
-            PostDataChunkBoostyVideo: DownloadContentTypeFilter.boosty_videos,
-            PostDataChunkExternalVideo: DownloadContentTypeFilter.external_videos,
-            PostDataChunkFile: DownloadContentTypeFilter.files,
-            PostDataChunkText: DownloadContentTypeFilter.post_content,
-            PostDataChunkTextualList: DownloadContentTypeFilter.post_content,
-            PostDataChunkImage: DownloadContentTypeFilter.post_content,
-        }
-
         for chunk in post.post_data_chunks:
-            filter_type = chunk_to_filter.get(type(chunk))
+            filter_type = _CHUNK_FILTERS.get(type(chunk))
             if filter_type and filter_type in missing_parts:
                 return True
         return False
@@ -131,20 +248,11 @@ class DownloadSinglePostUseCase:
         ApplicationFailedDownloadError: If the download fails for any reason for a specific post.
 
         """
-        mapping_result: PostMappingResult = map_post_dto_to_domain(
-            self.post_dto, preferred_video_quality=self.context.preferred_video_quality
-        )
-        post = mapping_result.post
-
-        if mapping_result.incomplete_content_types:
-            self.context.progress_reporter.warn(
-                f'Post has unfinished uploads (will retry next run): {self.destination.name}'
-            )
-
+        # Check the cache first: up-to-date posts don't need to be mapped at all.
         missing_parts: list[DownloadContentTypeFilter] = (
             self.context.post_cache.get_post_missing_parts(
-                post_uuid=post.uuid,
-                updated_at=post.updated_at,
+                post_uuid=self.post_dto.id,
+                updated_at=self.post_dto.updated_at,
                 required=self.context.filters,
             )
         )
@@ -155,6 +263,24 @@ class DownloadSinglePostUseCase:
             )
             return
 
+        mapping_result: PostMappingResult = map_post_dto_to_domain(
+            self.post_dto, preferred_video_quality=self.context.preferred_video_quality
+        )
+        post = mapping_result.post
+
+        if mapping_result.incomplete_content_types:
+            self.context.progress_reporter.warn(
+                f'Post has unfinished uploads (will retry next run): {self.destination.name}'
+            )
+
+        if (
+            mapping_result.unplayable_videos
+            and DownloadContentTypeFilter.boosty_videos in missing_parts
+        ):
+            self.context.progress_reporter.warn(
+                f'Skipped {mapping_result.unplayable_videos} video(s) without a playable URL: {self.destination.name}'
+            )
+
         if not self._should_execute(post, missing_parts):
             self.context.progress_reporter.notice(
                 'SKIP ([bold]no content[/bold] matching selected filters): '
@@ -162,24 +288,29 @@ class DownloadSinglePostUseCase:
             )
             return
 
-        self.destination.mkdir(parents=True, exist_ok=True)
+        # No upfront mkdir of the post directory: downloads create their own
+        # subdirectory and the renderer creates it for post.html, so posts with
+        # nothing to save don't leave empty folders behind.
         post_task_id = self._start_post_task(post)
         try:
-            post_html: list[HtmlGenChunk] = []
-
-            for chunk in post.post_data_chunks:
-                html_chunk = await self._safely_process_chunk(
-                    chunk, missing_parts, post
+            post_html = await self._process_chunks(post, missing_parts, post_task_id)
+
+            # Nothing to show (e.g. only files were selected): no empty page.
+            if post_html and DownloadContentTypeFilter.post_content in missing_parts:
+                # Rendering and writing are blocking: keep the loop free
+                # for the other posts' downloads.
+                renderer = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        render_html_to_file, post_html, out_path=self.post_file_path
+                    )
                 )
-                if html_chunk:
-                    post_html.append(html_chunk)
-
-                self._update_post_task(post_task_id)
-
-            if DownloadContentTypeFilter.post_content in missing_parts:
                 try:
-                    render_html_to_file(post_html, out_path=self.post_file_path)
+                    await asyncio.shield(renderer)
                 except CancelledError:
+                    # The thread can't be stopped: let it finish writing,
+                    # otherwise it could recreate the file after the unlink.
+                    with contextlib.suppress(Exception):
+                        await renderer
                     self.post_file_path.unlink(missing_ok=True)
                     raise
 
@@ -192,7 +323,6 @@ class DownloadSinglePostUseCase:
                 self.context.post_cache.cache_post(
                     post.uuid, post.updated_at, cacheable_parts
                 )
-                self.context.post_cache.commit()
             self.context.progress_reporter.success(
                 f'Finished:  {self.destination.name}'
             )
@@ -206,6 +336,42 @@ class DownloadSinglePostUseCase:
             indent_level=1,
         )
 
+    async def _process_chunks(
+        self,
+        post: Post,
+        missing_parts: list[DownloadContentTypeFilter],
+        post_task_id: uuid.UUID,
+    ) -> list[HtmlGenChunk]:
+        """
+        Process all chunks of the post and return their HTML in the post's order.
+
+        Chunks are processed concurrently, each kind (images, files, videos, ...)
+        bounded by its own limit from _CONCURRENT_CHUNKS_PER_KIND.
+        """
+        chunks = post.post_data_chunks
+        semaphores = {
+            kind: asyncio.Semaphore(limit)
+            for kind, limit in _CONCURRENT_CHUNKS_PER_KIND.items()
+        }
+
+        async def process_chunk(chunk: PostDataAllChunks) -> HtmlGenChunk | None:
+            semaphore = semaphores.get(type(chunk))
+            if semaphore is None:
+                html_chunk = await self._safely_process_chunk(
+                    chunk, missing_parts, post
+                )
+            else:
+                async with semaphore:
+                    html_chunk = await self._safely_process_chunk(
+                        chunk, missing_parts, post
+                    )
+            self._update_post_task(post_task_id)
+            return html_chunk
+
+        html_chunks = await gather_or_cancel(*map(process_chunk, chunks))
+
+        return [html_chunk for html_chunk in html_chunks if html_chunk]
+
     def _update_post_task(self, post_task_id: uuid.UUID) -> None:
         self.context.progress_reporter.update_task(
             post_task_id,
@@ -277,48 +443,41 @@ class DownloadSinglePostUseCase:
         chunk: PostDataAllChunks,
         missing_parts: list[DownloadContentTypeFilter],
     ) -> HtmlGenChunk | None:
+        # A chunk is only processed if the filter of its kind is missing
+        if _CHUNK_FILTERS.get(type(chunk)) not in missing_parts:
+            return None
         should_generate_post = DownloadContentTypeFilter.post_content in missing_parts
-        should_download_files = DownloadContentTypeFilter.files in missing_parts
-        should_download_videos = (
-            DownloadContentTypeFilter.boosty_videos in missing_parts
-        )
-        should_download_ext_videos = (
-            DownloadContentTypeFilter.external_videos in missing_parts
-        )
-        should_download_audio = DownloadContentTypeFilter.audio in missing_parts
 
         # ----------------------------------------------------------------------
         # Post Content (Text / List / Image) processing
-        if isinstance(chunk, PostDataChunkText) and should_generate_post:
+        if isinstance(chunk, PostDataChunkText):
             return convert_text_to_html(chunk)
-        if isinstance(chunk, PostDataChunkTextualList) and should_generate_post:
+        if isinstance(chunk, PostDataChunkTextualList):
             return convert_list_to_html(chunk)
-        if isinstance(chunk, PostDataChunkImage) and should_generate_post:
+        if isinstance(chunk, PostDataChunkImage):
             saved_as = await self.download_image(image=chunk)
             return HtmlGenImage(url=str(saved_as), alt=saved_as.name)
         # ----------------------------------------------------------------------
         # Boosty Video
-        if isinstance(chunk, PostDataChunkBoostyVideo) and should_download_videos:
+        if isinstance(chunk, PostDataChunkBoostyVideo):
             saved_as = await self.download_boosty_video(chunk)
-            if DownloadContentTypeFilter.post_content in missing_parts:
+            if should_generate_post:
                 return convert_video_to_html(src=str(saved_as), title=chunk.title)
         # ----------------------------------------------------------------------
         # External Video
-        elif (
-            isinstance(chunk, PostDataChunkExternalVideo) and should_download_ext_videos
-        ):
+        elif isinstance(chunk, PostDataChunkExternalVideo):
             saved_as = await self.download_external_videos(external_video=chunk)
-            if DownloadContentTypeFilter.post_content in missing_parts:
+            if should_generate_post:
                 return convert_video_to_html(src=str(saved_as), title=saved_as.name)
         # ----------------------------------------------------------------------
         # Files
-        elif isinstance(chunk, PostDataChunkFile) and should_download_files:
+        elif isinstance(chunk, PostDataChunkFile):
             await self.download_files(file=chunk)
         # ----------------------------------------------------------------------
         # Audio
-        elif isinstance(chunk, PostDataChunkAudio) and should_download_audio:
+        elif isinstance(chunk, PostDataChunkAudio):
             saved_as = await self.download_audio(audio=chunk)
-            if DownloadContentTypeFilter.post_content in missing_parts:
+            if should_generate_post:
                 return convert_audio_to_html(src=str(saved_as), title=chunk.title)
         return None
 
@@ -335,34 +494,32 @@ class DownloadSinglePostUseCase:
         guess_extension: bool = True,
     ) -> Path:
         """Download a file with progress tracking and return path relative to post directory."""
-        destination.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(destination)
         task_id = self.context.progress_reporter.create_task(task_label, indent_level=2)
 
-        def update_progress(status: DownloadingStatus) -> None:
-            downloaded = human_readable_size(status.total_downloaded_bytes)
-            total = human_readable_size(status.total_bytes)
-            self.context.progress_reporter.update_task(
-                task_id,
-                advance=status.downloaded_bytes,
-                total=status.total_bytes,
-                description=f'{task_label} [{downloaded} / {total}]',
-            )
+        progress = _DownloadProgress(
+            self.context.progress_reporter, task_id, task_label
+        )
 
+        # Chunks download concurrently: never let two of them write one file.
+        file_lock = self._file_locks.setdefault(destination / filename, asyncio.Lock())
         try:
-            path = await download_file(
-                DownloadFileConfig(
-                    session=self.context.downloader_session,
-                    url=url,
-                    filename=filename,
-                    destination=destination,
-                    guess_extension=guess_extension,
-                    on_status_update=update_progress,
+            async with file_lock:
+                path = await download_file(
+                    DownloadFileConfig(
+                        session=self.context.downloader_session,
+                        url=url,
+                        filename=filename,
+                        destination=destination,
+                        guess_extension=guess_extension,
+                        on_status_update=progress.on_file_status,
+                    )
                 )
-            )
+            progress.flush()
         finally:
             self.context.progress_reporter.complete_task(task_id)
 
-        return path.relative_to(self.post_file_path.parent)
+        return path.relative_to(self.destination)
 
     async def download_boosty_video(self, video: PostDataChunkBoostyVideo) -> Path:
         """Download a Boosty video and return the path to the saved file."""
@@ -376,32 +533,47 @@ class DownloadSinglePostUseCase:
     async def download_external_videos(
         self, external_video: PostDataChunkExternalVideo
     ) -> Path:
-        """Download an external video using yt-dlp."""
-        self.external_videos_destination.mkdir(parents=True, exist_ok=True)
+        """Download an external video using yt-dlp (it creates the directory itself)."""
         task_id = self.context.progress_reporter.create_task(
             f'External video: {external_video.url}', indent_level=2
         )
 
-        def update_progress(status: ExternalVideoDownloadStatus) -> None:
-            downloaded = human_readable_size(status.downloaded_bytes)
-            total = human_readable_size(status.total_bytes)
-            self.context.progress_reporter.update_task(
-                task_id,
-                advance=status.delta_bytes,
-                total=status.total_bytes,
-                description=f'External video [{downloaded} / {total}]: {external_video.url}',
-            )
+        progress = _DownloadProgress(
+            self.context.progress_reporter,
+            task_id,
+            label='External video',
+            suffix=f': {external_video.url}',
+        )
 
-        try:
-            path = self.context.external_videos_downloader.download_video(
+        # A worker thread can't be cancelled: the event tells yt-dlp to stop,
+        # otherwise it would keep downloading (and delay the exit) after Ctrl+C.
+        cancel_event = threading.Event()
+        # yt-dlp is blocking: run it in a worker thread to keep the other
+        # downloads going. Its progress hook then fires from that thread,
+        # which Rich progress handles (its updates are locked).
+        worker = asyncio.ensure_future(
+            asyncio.to_thread(
+                self.context.external_videos_downloader.download_video,
                 url=external_video.url,
                 destination_directory=self.external_videos_destination,
-                progress_hook=update_progress,
+                progress_hook=progress.on_external_video_status,
+                cancel_event=cancel_event,
             )
+        )
+        try:
+            path = await asyncio.shield(worker)
+            progress.flush()
+        except CancelledError:
+            cancel_event.set()
+            # Wait for the thread to stop, so a retry of the post doesn't
+            # write to the same files while the old download still runs.
+            with contextlib.suppress(Exception):
+                await worker
+            raise
         finally:
             self.context.progress_reporter.complete_task(task_id)
 
-        return path.relative_to(self.external_videos_destination.parent)
+        return path.relative_to(self.destination)
 
     async def download_files(self, file: PostDataChunkFile) -> Path:
         """Download a file attachment."""
@@ -414,11 +586,12 @@ class DownloadSinglePostUseCase:
 
     async def download_image(self, image: PostDataChunkImage) -> Path:
         """Download an image."""
+        filename = URL(image.url).name
         return await self._download_with_progress(
             url=image.url,
-            filename=URL(image.url).name,
+            filename=filename,
             destination=self.images_destination,
-            task_label=f'Image: {URL(image.url).name}',
+            task_label=f'Image: {filename}',
             guess_extension=False,
         )
 
@@ -7,14 +7,13 @@ from typing import TYPE_CHECKING
 from boosty_downloader.src.application.di.download_context import DownloadContext
 from boosty_downloader.src.application.exceptions.application_errors import (
     ApplicationCancelledError,
+    ApplicationFailedDownloadError,
 )
-from boosty_downloader.src.application.use_cases.check_total_posts import (
-    BoostyAPIClient,
-)
+from boosty_downloader.src.application.post_naming import sanitized_post_title
 from boosty_downloader.src.application.use_cases.download_single_post import (
-    ApplicationFailedDownloadError,
     DownloadSinglePostUseCase,
 )
+from boosty_downloader.src.infrastructure.boosty_api.core.client import BoostyAPIClient
 from boosty_downloader.src.infrastructure.boosty_api.models.unknown_content import (
     collect_unknown_content,
 )
@@ -23,7 +22,6 @@ from boosty_downloader.src.infrastructure.boosty_api.utils.validation_errors imp
     format_run_summary,
     format_skipped_post,
 )
-from boosty_downloader.src.infrastructure.file_downloader import sanitize_string
 
 if TYPE_CHECKING:
     from boosty_downloader.src.infrastructure.boosty_api.models.post.post import (
@@ -147,12 +145,7 @@ class DownloadPostByUrlUseCase:
         if summary:
             self.context.progress_reporter.warn(summary)
 
-        post_title = post.title
-        if len(post_title) == 0:
-            post_title = f'No title (id_{post.id[:8]})'
-
-        post_name = f'{post.created_at.date()} - {post_title}'
-        post_name = sanitize_string(post_name).replace('.', '').strip()
+        post_name = f'{post.created_at.date()} - {sanitized_post_title(post)}'
 
         try:
             await DownloadSinglePostUseCase(
@@ -130,13 +130,13 @@ class ProgressReporter:
         self._logger.info(message)
 
     def success(self, message: str) -> None:
-        self._logger.info(f'[bold green]✔ {message}[/bold green]')
+        self._logger.info('[bold green]✔ %s[/bold green]', message)
 
     def warn(self, message: str) -> None:
-        self._logger.warning(f'[bold yellow]⚠ {message}[/bold yellow]')
+        self._logger.warning('[bold yellow]⚠ %s[/bold yellow]', message)
 
     def error(self, message: str) -> None:
-        self._logger.error(f'[bold red]✖ {message}[/bold red]')
+        self._logger.error('[bold red]✖ %s[/bold red]', message)
 
     def notice(self, message: str) -> None:
         self.console.print(
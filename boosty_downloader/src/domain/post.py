@@ -30,7 +30,7 @@ PostDataPostOnlyChunksList = list[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Post on boosty.to which have different kinds of content (images, text, videos, etc.)"""
 
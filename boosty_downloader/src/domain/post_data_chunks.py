@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkAudio:
     """Represent an audio data chunk within a post."""
 
@@ -16,14 +16,14 @@ class PostDataChunkAudio:
     title: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkImage:
     """Represent an image data chunk within a post."""
 
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkText:
     """
     Represent a textual data chunk within a post.
@@ -40,7 +40,7 @@ class PostDataChunkText:
             ]
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class TextFragment:
         """
         Represent a text fragment within a post with possibly additional styling.
@@ -48,7 +48,7 @@ class PostDataChunkText:
         It also can contain a link to external resources (if link_data == None - it's just a text).
         """
 
-        @dataclass
+        @dataclass(slots=True)
         class TextStyle:
             """Represent text styling options."""
 
@@ -64,7 +64,7 @@ class PostDataChunkText:
     text_fragments: list[TextFragment]
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkBoostyVideo:
     """Represent a Boosty video data chunk within a post."""
 
@@ -73,7 +73,7 @@ class PostDataChunkBoostyVideo:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkExternalVideo:
     """
     Represent an external video data chunk within a post.
@@ -84,7 +84,7 @@ class PostDataChunkExternalVideo:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkFile:
     """Represent a file data chunk within a post."""
 
@@ -92,7 +92,7 @@ class PostDataChunkFile:
     filename: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataChunkTextualList:
     """
     Represent a list of text items within a post.
@@ -141,7 +141,7 @@ class PostDataChunkTextualList:
       - Item 3
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class ListItem:
         """'Represent a single item in a textual list."""
 
@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from http import HTTPStatus
 from typing import TYPE_CHECKING, cast
 
-from aiohttp import ContentTypeError
 from aiolimiter import AsyncLimiter
 from pydantic import ValidationError
 from yarl import URL
@@ -14,8 +12,10 @@ from yarl import URL
 from boosty_downloader.src.infrastructure.boosty_api.core.endpoints import (
     BOOSTY_DEFAULT_BASE_URL,
 )
-from boosty_downloader.src.infrastructure.boosty_api.models.post.extra import Extra
 from boosty_downloader.src.infrastructure.boosty_api.models.post.post import PostDTO
+from boosty_downloader.src.infrastructure.boosty_api.models.post.posts_page import (
+    PostsPageDTO,
+)
 from boosty_downloader.src.infrastructure.boosty_api.models.post.posts_request import (
     PostsResponse,
     SkippedPost,
@@ -101,6 +101,16 @@ def _create_limiter(request_delay_seconds: float) -> AsyncLimiter | None:
     return None
 
 
+def _detach_inputs(errors: list[ErrorDetails]) -> list[ErrorDetails]:
+    # Skipped posts are held until the end-of-run summary, and an error's
+    # 'input' can be the whole raw post (e.g. for a missing field). Keep only
+    # the inputs the summary prints - the offending enum words.
+    return [
+        error if error['type'] == 'enum' else {**error, 'input': None}
+        for error in errors
+    ]
+
+
 class BoostyAPIClient:
     """
     Main client class for the Boosty API.
@@ -118,7 +128,8 @@ class BoostyAPIClient:
         request_delay_seconds: float = 0.0,
         base_url: URL | None = None,
     ) -> None:
-        self._base_url = base_url or BOOSTY_DEFAULT_BASE_URL
+        # Parsed once: the default base URL is a plain string
+        self._base_url = URL(base_url or BOOSTY_DEFAULT_BASE_URL)
         self.session = session
         self._limiter = _create_limiter(request_delay_seconds)
 
@@ -128,7 +139,7 @@ class BoostyAPIClient:
         params: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
     ) -> ClientResponse:
-        url = URL(self._base_url) / endpoint.lstrip('/')
+        url = self._base_url / endpoint.lstrip('/')
 
         if self._limiter:
             async with self._limiter:
@@ -175,19 +186,26 @@ class BoostyAPIClient:
                 posts_raw.status, f'Unexpected status code: {posts_raw.status}'
             )
 
-        # Status is OK here, so a non-JSON body means a broken response
+        # The body goes straight to pydantic-core: JSON parsing and the
+        # envelope check happen in one pass, with no stdlib json round.
+        # Without the envelope (e.g. no 'data' or a broken 'extra') the walk
+        # can't continue, so that fails the page.
+        body = await posts_raw.read()
         try:
-            posts_data = await posts_raw.json()
-        except (ContentTypeError, json.JSONDecodeError) as e:
-            raise BoostyAPIUnknownError(
-                posts_raw.status, 'Non-JSON response from the API'
-            ) from e
+            page = PostsPageDTO.model_validate_json(body)
+        except ValidationError as e:
+            # Status is OK here, so a non-JSON body means a broken response
+            if any(error['type'] == 'json_invalid' for error in e.errors()):
+                raise BoostyAPIUnknownError(
+                    posts_raw.status, 'Non-JSON response from the API'
+                ) from e
+            raise BoostyAPIValidationError(errors=e.errors()) from e
 
         # Posts are validated one by one: a post this client can't parse
         # must not fail the page - the caller reports it and the run goes on.
         posts: list[PostDTO] = []
         skipped_posts: list[SkippedPost] = []
-        for raw_post in posts_data['data']:
+        for raw_post in page.data:
             try:
                 posts.append(PostDTO.model_validate(raw_post))
             except ValidationError as e:  # noqa: PERF203 per-post isolation is the point here
@@ -200,20 +218,13 @@ class BoostyAPIClient:
                     SkippedPost(
                         post_id=str(raw_info.get('id', '<no id>')),
                         title=str(raw_info.get('title', '<no title>')),
-                        errors=e.errors(),
+                        errors=_detach_inputs(e.errors()),
                     )
                 )
 
-        # Pagination info is different: without it the walk can't continue,
-        # so a broken 'extra' is still an error for the whole page.
-        try:
-            extra: Extra = Extra.model_validate(posts_data['extra'])
-        except ValidationError as e:
-            raise BoostyAPIValidationError(errors=e.errors()) from e
-
         return PostsResponse(
             posts=posts,
-            extra=extra,
+            extra=page.extra,
             skipped_posts=skipped_posts,
         )
 
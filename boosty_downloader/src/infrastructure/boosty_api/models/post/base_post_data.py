@@ -6,7 +6,7 @@ Only essentials fields defined for parsing purposes.
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, cast, get_args
 
 from pydantic import BeforeValidator, Field, TypeAdapter, ValidationError
 
@@ -44,15 +44,37 @@ _KNOWN_POST_DATA = TypeAdapter[KnownPostData](KnownPostData)
 # as opposed to a known chunk arriving with a broken body.
 _UNKNOWN_TAG_ERRORS = frozenset({'union_tag_invalid', 'union_tag_not_found'})
 
+# Type tags of the known chunks, read from their Literal 'type' fields
+_KNOWN_TAGS = frozenset(
+    tag
+    for dto in get_args(get_args(KnownPostData)[0])
+    for tag in get_args(dto.model_fields['type'].annotation)
+)
+
 
 def _chunk_or_unknown(value: object) -> object:
     """
     Parse a post data chunk by its type tag.
 
-    A chunk with an unknown tag becomes BoostyPostDataUnknownDTO.
+    A chunk with an unknown or absent tag becomes BoostyPostDataUnknownDTO.
     A known chunk with a broken body stays a validation error:
     masking it as unknown would silently drop real content.
     """
+    # Raw API chunks are dicts: their tag is checked up front instead of
+    # raising and catching a union error, since a new Boosty chunk type
+    # tends to show up in every post of the run.
+    tag = (
+        cast('dict[str, object]', value).get('type')
+        if isinstance(value, dict)
+        else None
+    )
+    if isinstance(tag, str):
+        if tag not in _KNOWN_TAGS:
+            return BoostyPostDataUnknownDTO.model_validate(value)
+        return _KNOWN_POST_DATA.validate_python(value)
+
+    # Anything else (absent or non-string tags, already built DTOs)
+    # is left to the union's errors
     try:
         return _KNOWN_POST_DATA.validate_python(value)
     except ValidationError as e:
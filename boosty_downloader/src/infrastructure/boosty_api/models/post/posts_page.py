@@ -0,0 +1,16 @@
+"""Raw envelope of a posts page from boosty.to"""
+
+from boosty_downloader.src.infrastructure.boosty_api.models.base import BoostyBaseDTO
+from boosty_downloader.src.infrastructure.boosty_api.models.post.extra import Extra
+
+
+class PostsPageDTO(BoostyBaseDTO):
+    """
+    Envelope of one posts page: pagination info plus the still raw posts.
+
+    Posts are left unparsed on purpose, so the client can validate them
+    one by one and skip the broken ones instead of failing the page.
+    """
+
+    data: list[object]
+    extra: Extra
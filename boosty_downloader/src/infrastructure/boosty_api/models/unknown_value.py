@@ -1,6 +1,7 @@
 """Wrapper for API values this client doesn't know yet."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import BeforeValidator
@@ -19,10 +20,18 @@ class BoostyUnknownValue:
     raw: str
 
 
+# A new word usually repeats across the run (e.g. the same video format in
+# every post), so one shared instance per word is handed out. It's frozen,
+# so sharing is safe.
+@lru_cache(maxsize=256)
+def _interned_unknown_value(raw: str) -> BoostyUnknownValue:
+    return BoostyUnknownValue(raw=raw)
+
+
 def _wrap_raw_value(value: object) -> object:
     if isinstance(value, BoostyUnknownValue):
         return value
-    return BoostyUnknownValue(raw=str(value))
+    return _interned_unknown_value(str(value))
 
 
 # Field-annotation form: any non-enum value is wrapped, keeping the raw word.
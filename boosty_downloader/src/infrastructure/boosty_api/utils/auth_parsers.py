@@ -1,25 +1,65 @@
 """Cookie and authorization parser module for raw-browser-data parsing"""
 
-from http.cookies import SimpleCookie
+from __future__ import annotations
+
+from http.cookies import CookieError
+from typing import TYPE_CHECKING
 
 import aiohttp
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def parse_session_cookie(
+    cookie_string: str,
+    on_skipped_cookie: Callable[[str], None] | None = None,
+) -> aiohttp.CookieJar:
+    """
+    Parse the session cookie and return a dictionary with auth data for aiohttp client.
 
-def parse_session_cookie(cookie_string: str) -> aiohttp.CookieJar:
-    """Parse the session cookie and return a dictionary with auth data for aiohttp client."""
+    Cookies whose names the jar rejects (e.g. `b[0]`) are skipped one by one,
+    reported via `on_skipped_cookie`, and don't affect the cookies after them.
+    """
     if cookie_string.lower().startswith('cookie: '):
         cookie_string = cookie_string[8:].strip()
 
-    cookie = SimpleCookie()
-    cookie.load(cookie_string)
-
     jar = aiohttp.CookieJar()
-    for key, morsel in cookie.items():
-        jar.update_cookies({key: morsel.value})
-
+    pairs = _split_cookie_pairs(cookie_string)
+    # One batched update for the usual case, cookie by cookie only to find
+    # the rejected ones (re-adding the already added cookies is harmless).
+    if not _add_cookies(jar, pairs):
+        for name, value in pairs:
+            if not _add_cookies(jar, [(name, value)]) and on_skipped_cookie:
+                on_skipped_cookie(name)
     return jar
 
 
+def _add_cookies(jar: aiohttp.CookieJar, pairs: list[tuple[str, str]]) -> bool:
+    # The jar validates names through SimpleCookie, which rejects e.g. 'b[0]'
+    try:
+        jar.update_cookies(pairs)
+    except CookieError:
+        return False
+    return True
+
+
+def _split_cookie_pairs(cookie_string: str) -> list[tuple[str, str]]:
+    # A Cookie header is just 'name=value; name=value', quoted values
+    # can't contain ';' so splitting on it is safe for them too.
+    pairs: list[tuple[str, str]] = []
+    for pair in cookie_string.split(';'):
+        name, _, value = pair.partition('=')
+        name = name.strip()
+        if not name:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':  # noqa: PLR2004
+            value = value[1:-1]
+        pairs.append((name, value))
+    return pairs
+
+
 def parse_auth_header(header: str) -> dict[str, str]:
     """Parse the authorization header and return a dictionary with auth data."""
     return {'Authorization': header}
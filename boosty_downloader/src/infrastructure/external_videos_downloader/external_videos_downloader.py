@@ -7,10 +7,10 @@ import contextlib
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from yt_dlp.YoutubeDL import YoutubeDL
-from yt_dlp.utils import DownloadError
+if TYPE_CHECKING:
+    import threading
 
 YtDlOptions = dict[str, Any]
 ExternalVideoDownloadProgressHook = Callable[['ExternalVideoDownloadStatus'], None]
@@ -100,9 +100,24 @@ class ExternalVideosDownloader:
         url: str,
         destination_directory: Path,
         progress_hook: ExternalVideoDownloadProgressHook | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> Path:
-        """Download video using yt-dlp and repeatedly report progress via progress_hook callback until completion."""
+        """
+        Download video using yt-dlp and repeatedly report progress via progress_hook callback until completion.
+
+        Setting `cancel_event` (e.g. from another thread) stops the download
+        after probing or at its next progress report with
+        ExtVideoInterruptedByUserError.
+        """
+        # yt-dlp takes ~0.1s to import, only pay for it when there is a video.
+        from yt_dlp.YoutubeDL import YoutubeDL  # noqa: PLC0415
+        from yt_dlp.utils import DownloadCancelled, DownloadError  # noqa: PLC0415
+
         info = self._probe_video(url)
+        # Probing can take a while and has no progress hook to stop it
+        if cancel_event is not None and cancel_event.is_set():
+            raise ExtVideoInterruptedByUserError
+
         title = info.get('title')
         if not isinstance(title, str) or not title.strip():
             raise ExtVideoInfoError(url)
@@ -113,7 +128,9 @@ class ExternalVideosDownloader:
         outtmpl = self._build_outtmpl(destination_directory, clean_title)
 
         state = _HookState()
-        internal_hook = self._make_progress_hook(outtmpl, progress_hook, state)
+        internal_hook = self._make_progress_hook(
+            outtmpl, progress_hook, state, cancel_event
+        )
 
         options: YtDlOptions = self._default_ydl_options.copy()
         options['outtmpl'] = outtmpl
@@ -124,7 +141,7 @@ class ExternalVideosDownloader:
                 try:
                     # yt-dlp isn't typed; cast to Any and coerce to int
                     errors: int = int(cast('Any', ydl).download([url]))
-                except KeyboardInterrupt as e:
+                except (KeyboardInterrupt, DownloadCancelled) as e:
                     raise ExtVideoInterruptedByUserError from e
 
             if errors != 0:
@@ -141,6 +158,9 @@ class ExternalVideosDownloader:
         return destination_directory / f'{clean_title}.{guessed_ext}'
 
     def _probe_video(self, url: str) -> dict[str, Any]:
+        from yt_dlp.YoutubeDL import YoutubeDL  # noqa: PLC0415
+        from yt_dlp.utils import DownloadError  # noqa: PLC0415
+
         # Extract metadata without downloading to validate and fetch title/ext.
         try:
             opts = {**self._default_ydl_options, 'skip_download': True}
@@ -167,8 +187,15 @@ class ExternalVideosDownloader:
         outtmpl: str,
         user_hook: ExternalVideoDownloadProgressHook | None,
         state: _HookState,
+        cancel_event: threading.Event | None = None,
     ) -> Callable[[dict[str, Any]], None]:
+        from yt_dlp.utils import DownloadCancelled  # noqa: PLC0415
+
         def _hook(d: dict[str, Any]) -> None:
+            # yt-dlp stops the download when a hook raises DownloadCancelled
+            if cancel_event is not None and cancel_event.is_set():
+                raise DownloadCancelled
+
             filename = d.get('filename') or d.get('tmpfilename') or outtmpl
             name = Path(str(filename)).name
 
@@ -6,6 +6,7 @@ import http
 import mimetypes
 from asyncio import CancelledError
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import aiofiles
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from aiohttp_retry import RetryClient
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadingStatus:
     """
     Model for status of the download.
@@ -113,6 +114,22 @@ class DownloadUnexpectedStatusError(DownloadError):
         self.response_message = response_message
 
 
+@lru_cache(maxsize=64)
+def _guess_extension(content_type: str) -> str | None:
+    """Guess the file extension, Boosty serves only a handful of content types."""
+    return mimetypes.guess_extension(content_type)
+
+
+def _is_already_downloaded(file_path: Path, expected_size: int | None) -> bool:
+    """Check if the file exists with exactly the size the server is about to send."""
+    if expected_size is None:
+        return False
+    try:
+        return file_path.stat().st_size == expected_size
+    except OSError:
+        return False
+
+
 async def download_file(
     dl_config: DownloadFileConfig,
 ) -> Path:
@@ -130,15 +147,26 @@ async def download_file(
 
         content_type = response.content_type
         if content_type and dl_config.guess_extension:
-            ext = mimetypes.guess_extension(content_type)
+            ext = _guess_extension(content_type)
             if ext is not None:
                 file_path = file_path.with_suffix(ext)
 
+        total_size = response.content_length
+        if _is_already_downloaded(file_path, total_size):
+            # Left by an earlier (e.g. interrupted) run: don't fetch the body again
+            dl_config.on_status_update(
+                DownloadingStatus(
+                    name=filename,
+                    total_bytes=total_size,
+                    total_downloaded_bytes=total_size,
+                    downloaded_bytes=total_size,
+                ),
+            )
+            return file_path
+
         total_downloaded = 0
 
         async with aiofiles.open(file_path, mode='wb') as file:
-            total_size = response.content_length
-
             try:
                 async for chunk in response.content.iter_chunked(
                     dl_config.chunk_size_bytes
@@ -50,6 +50,12 @@ class RichLogger:
     def __init__(self, prefix: str) -> None:
         self._prefix = prefix
         self._logger = logging.getLogger(prefix)
+        # The markup prefix depends only on the logger and the style, so it is
+        # built once here instead of on every log call.
+        self._line_prefixes = {
+            name: f'[cyan]{prefix}[/cyan][{style.color}].{style.label} {style.emoji}[/{style.color}]:'
+            for name, style in self._STYLES.items()
+        }
 
         if prefix not in self._initialized_loggers:
             self._logger.setLevel(logging.DEBUG)
@@ -76,9 +82,13 @@ class RichLogger:
         exc_info: bool = False,
     ) -> None:
         style = self._STYLES[style_name]
-        prefix = f'[cyan]{self._prefix}[/cyan][{style.color}].{style.label} {style.emoji}[/{style.color}]:'
+        prefix = self._line_prefixes[style_name]
         indentation = '    ' * indent
-        self._logger.log(style.level, f'{indentation}{prefix} {msg}', exc_info=exc_info)
+        # Arguments instead of a pre-built string: the line is only formatted
+        # if a handler actually emits it.
+        self._logger.log(
+            style.level, '%s%s %s', indentation, prefix, msg, exc_info=exc_info
+        )
 
     def debug(self, msg: str, *, indent: int = 0) -> None:
         self._log('debug', msg, indent=indent)
@@ -5,11 +5,14 @@ Format: "[<id>]: <message>"; duplicates are suppressed by <id>.
 The log file and its parent directory are created on demand; writes append.
 """
 
+import asyncio
 import re
 from pathlib import Path
 
 import aiofiles
 
+_LINE_ID = re.compile(r'^\[(?P<id>[^\]]+)\]:')
+
 
 class FailedDownloadsLogger:
     """
@@ -24,6 +27,9 @@ class FailedDownloadsLogger:
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self._seen_ids: set[str] = set()
         self._loaded = False
+        # Single flight for concurrent downloads failing at once: the file is
+        # loaded once and each id is checked and written under the same lock.
+        self._lock = asyncio.Lock()
 
     async def _ensure_loaded(self) -> None:
         if self._loaded:
@@ -32,10 +38,9 @@ class FailedDownloadsLogger:
             self._loaded = True
             return
 
-        pattern = re.compile(r'^\[(?P<id>[^\]]+)\]:')
         async with aiofiles.open(self.file_path, encoding='utf-8') as f:
             async for line in f:
-                m = pattern.match(line.strip())
+                m = _LINE_ID.match(line.strip())
                 if m:
                     self._seen_ids.add(m.group('id'))
         self._loaded = True
@@ -53,9 +58,10 @@ class FailedDownloadsLogger:
         error_id = error_id.strip()
         message = message.strip()
 
-        await self._ensure_loaded()
-        if error_id in self._seen_ids:
-            return
+        async with self._lock:
+            await self._ensure_loaded()
+            if error_id in self._seen_ids:
+                return
 
-        await self._write_line(f'[{error_id}]: {message}')
-        self._seen_ids.add(error_id)
+            await self._write_line(f'[{error_id}]: {message}')
+            self._seen_ids.add(error_id)
@@ -2,9 +2,14 @@
 
 import re
 
+_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]')
+
 
 def sanitize_string(string: str) -> str:
     """Remove unsafe filesystem characters from a string"""
     # Convert path to a string and sanitize it
-    unsafe_chars = r'[<>:"/\\|?*]'
-    return re.sub(unsafe_chars, '', str(string))
+    string = str(string)
+    # Most titles are already clean: searching is cheaper than substituting
+    if _UNSAFE_CHARS.search(string) is None:
+        return string
+    return _UNSAFE_CHARS.sub('', string)
@@ -1,10 +1,12 @@
 """Implementation of a post cache using SQLAlchemy + SQLite local database."""
 
+import sqlite3
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
 from types import TracebackType
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import Engine, create_engine, event, exists, inspect, select
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -15,6 +17,25 @@ from .migrations import apply_migrations
 from .models import Base, PostCacheEntryModel
 
 
+def _create_engine(db_file: Path) -> Engine:
+    engine = create_engine(f'sqlite:///{db_file}')
+    event.listen(engine, 'connect', _configure_connection)
+    return engine
+
+
+def _configure_connection(
+    dbapi_connection: sqlite3.Connection, _connection_record: object
+) -> None:
+    # Every commit is a full fsync by default. The cache rebuilds itself when
+    # it finds itself corrupted, so NORMAL durability is plenty here.
+    # WAL is left off on purpose: the cache often sits next to the downloads,
+    # which may be on network storage where WAL's shared memory doesn't work.
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+
 class SQLitePostCache:
     """
     Post cache using SQLite with SQLAlchemy.
@@ -27,6 +48,9 @@ class SQLitePostCache:
 
     If the database doesn't exist, it will be created with all needed migrations applied.
     But if the end user modify something by hand - the database will be reinitialized (considering it's corrupted).
+
+    The cache is not thread-safe, use it from the event loop thread only.
+    None of its methods await, so concurrent coroutines can share it freely.
     """
 
     DEFAULT_CACHE_FILENAME = 'post_cache.db'
@@ -40,12 +64,17 @@ class SQLitePostCache:
         self._logger = logger
         self._destination = destination
         self._db_file: Path = self._destination / self.DEFAULT_CACHE_FILENAME
-        self._db_file.parent.mkdir(parents=True, exist_ok=True)
+        if not self._db_file.exists():
+            self._db_file.parent.mkdir(parents=True, exist_ok=True)
 
-        self._engine = create_engine(f'sqlite:///{self._db_file}')
+        self._engine = _create_engine(self._db_file)
         self._session_maker = sessionmaker(bind=self._engine, expire_on_commit=False)
         self._session: Session = self._session_maker()
         self._dirty = False
+        # Entries loaded by prefetch(), None for posts that aren't cached yet.
+        # The session's identity map only keeps weak references and can't
+        # remember misses, so this is what answers lookups without a SELECT.
+        self._prefetched: dict[str, PostCacheEntryModel | None] = {}
 
         apply_migrations(self._engine, self._session)
 
@@ -55,6 +84,9 @@ class SQLitePostCache:
             )
             self._reinitialize_db()
 
+        # On a fresh cache nothing can be found, so lookups skip SQL entirely.
+        self._is_empty = not self._session.scalar(select(exists(PostCacheEntryModel)))
+
     def __enter__(self) -> 'SQLitePostCache':
         """Create a context manager for the SQLitePostCache."""
         return self
@@ -90,6 +122,25 @@ class SQLitePostCache:
             self._session.commit()
             self._dirty = False
 
+    def prefetch(self, post_uuids: Collection[str]) -> None:
+        """
+        Load cache entries for a batch of posts (e.g. one page) in one query.
+
+        Later lookups for these posts are answered from memory instead of
+        issuing a SELECT per post. Entries from the previous batch are dropped.
+        """
+        self._prefetched = dict.fromkeys(post_uuids)
+        if self._is_empty:
+            return
+
+        entries = self._session.scalars(
+            select(PostCacheEntryModel).where(
+                PostCacheEntryModel.post_uuid.in_(post_uuids)
+            )
+        )
+        for entry in entries:
+            self._prefetched[entry.post_uuid] = entry
+
     def cache_post(
         self,
         post_uuid: str,
@@ -97,7 +148,7 @@ class SQLitePostCache:
         was_downloaded: list[DownloadContentTypeFilter],
     ) -> None:
         """Cache a post by its UUID and updated_at timestamp."""
-        entry = self._session.get(PostCacheEntryModel, post_uuid)
+        entry = self._get_entry(post_uuid)
 
         if entry:
             entry.last_updated_timestamp = updated_at.isoformat()
@@ -107,6 +158,8 @@ class SQLitePostCache:
                 post_uuid, updated_at, was_downloaded
             )
             self._session.add(entry)
+            self._prefetched[post_uuid] = entry
+            self._is_empty = False
 
         self._dirty = True
 
@@ -123,7 +176,7 @@ class SQLitePostCache:
         returns only those parts that haven't been downloaded yet based on the
         current cache state.
         """
-        post = self._session.get(PostCacheEntryModel, post_uuid)
+        post = self._get_entry(post_uuid)
         if not post:
             return required
 
@@ -137,6 +190,13 @@ class SQLitePostCache:
         """Reinitialize the cache completely in case if user wants to start fresh."""
         self._reinitialize_db()
 
+    def _get_entry(self, post_uuid: str) -> PostCacheEntryModel | None:
+        if post_uuid in self._prefetched:
+            return self._prefetched[post_uuid]
+        if self._is_empty:
+            return None
+        return self._session.get(PostCacheEntryModel, post_uuid)
+
     # -------------------------------------------------------------------------
     # Private: Database health
     # -------------------------------------------------------------------------
@@ -153,13 +213,15 @@ class SQLitePostCache:
 
     def _reinitialize_db(self) -> None:
         """Reinitialize the database (recreate it from scratch) and recreate session."""
+        self._prefetched = {}
+        self._is_empty = True
         self._session.close()
         self._engine.dispose()
 
         if self._db_file.exists():
             self._db_file.unlink()
 
-        self._engine = create_engine(f'sqlite:///{self._db_file}')
+        self._engine = _create_engine(self._db_file)
         Base.metadata.create_all(self._engine)
         self._session = self._session_maker()
 
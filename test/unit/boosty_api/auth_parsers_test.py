@@ -0,0 +1,56 @@
+"""Tests for parsing auth data copied from the browser."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from boosty_downloader.src.infrastructure.boosty_api.utils.auth_parsers import (
+    parse_session_cookie,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+def _as_dict(jar: aiohttp.CookieJar) -> dict[str, str]:
+    return {morsel.key: morsel.value for morsel in jar}
+
+
+@pytest.mark.asyncio
+async def test_plain_cookie_header_is_split_into_pairs():
+    jar = parse_session_cookie('auth=abc123; _ym_uid=42; theme=dark')
+
+    assert _as_dict(jar) == {'auth': 'abc123', '_ym_uid': '42', 'theme': 'dark'}
+
+
+@pytest.mark.asyncio
+async def test_cookie_prefix_and_stray_separators_are_ignored():
+    jar = parse_session_cookie('Cookie: auth=abc; ;session=x=y;')
+
+    assert _as_dict(jar) == {'auth': 'abc', 'session': 'x=y'}
+
+
+@pytest.mark.asyncio
+async def test_quoted_values_are_unquoted():
+    jar = parse_session_cookie('auth="abc 123"; theme=dark')
+
+    assert _as_dict(jar) == {'auth': 'abc 123', 'theme': 'dark'}
+
+
+@pytest.mark.asyncio
+async def test_cookie_with_illegal_name_is_skipped_and_reported():
+    skipped: list[str] = []
+
+    jar = parse_session_cookie('a=1; b[0]=2; c=3', on_skipped_cookie=skipped.append)
+
+    assert _as_dict(jar) == {'a': '1', 'c': '3'}
+    assert skipped == ['b[0]']
+
+
+@pytest.mark.asyncio
+async def test_quote_in_value_keeps_the_cookies_after_it():
+    jar = parse_session_cookie('a=1; b={"x":1}; [c]=2; d=3')
+
+    assert _as_dict(jar) == {'a': '1', 'b': '{"x":1}', 'd': '3'}
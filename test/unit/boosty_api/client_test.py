@@ -7,7 +7,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 import pytest
-from aiohttp import ContentTypeError
 
 from boosty_downloader.src.infrastructure.boosty_api.core.client import (
     BoostyAPIClient,
@@ -19,26 +18,28 @@ from boosty_downloader.src.infrastructure.boosty_api.core.client import (
 )
 
 if TYPE_CHECKING:
-    from aiohttp import RequestInfo
     from aiohttp_retry import RetryClient
 
 
-class _JsonMustNotBeCalledError(AssertionError):
+class _BodyMustNotBeReadError(AssertionError):
     """Raised by the fake response when a test forbids body parsing."""
 
 
 @dataclass
 class _FakeResponse:
-    """Prepared HTTP response: a status plus either a JSON body or a parse error."""
+    """Prepared HTTP response: a status plus either a JSON body or a raw one."""
 
     status: int
     json_data: Any = None
-    json_error: Exception | None = None
+    raw_body: bytes | None = None
+    read_error: Exception | None = None
 
-    async def json(self) -> object:
-        if self.json_error is not None:
-            raise self.json_error
-        return self.json_data
+    async def read(self) -> bytes:
+        if self.read_error is not None:
+            raise self.read_error
+        if self.raw_body is not None:
+            return self.raw_body
+        return json.dumps(self.json_data).encode()
 
 
 class _FakeSession:
@@ -62,7 +63,7 @@ VALID_EXTRA: Any = {'offset': '', 'isLast': True}
 @pytest.mark.asyncio
 async def test_404_maps_to_no_username_error_without_parsing_body():
     client = _make_client(
-        _FakeResponse(status=404, json_error=_JsonMustNotBeCalledError())
+        _FakeResponse(status=404, read_error=_BodyMustNotBeReadError())
     )
 
     with pytest.raises(BoostyAPINoUsernameError) as exc_info:
@@ -74,7 +75,7 @@ async def test_404_maps_to_no_username_error_without_parsing_body():
 @pytest.mark.asyncio
 async def test_401_maps_to_unauthorized_error_without_parsing_body():
     client = _make_client(
-        _FakeResponse(status=401, json_error=_JsonMustNotBeCalledError())
+        _FakeResponse(status=401, read_error=_BodyMustNotBeReadError())
     )
 
     with pytest.raises(BoostyAPIUnauthorizedError):
@@ -84,7 +85,7 @@ async def test_401_maps_to_unauthorized_error_without_parsing_body():
 @pytest.mark.asyncio
 async def test_400_maps_to_invalid_username_error_without_parsing_body():
     client = _make_client(
-        _FakeResponse(status=400, json_error=_JsonMustNotBeCalledError())
+        _FakeResponse(status=400, read_error=_BodyMustNotBeReadError())
     )
 
     with pytest.raises(BoostyAPIInvalidUsernameError) as exc_info:
@@ -96,7 +97,7 @@ async def test_400_maps_to_invalid_username_error_without_parsing_body():
 @pytest.mark.asyncio
 async def test_unexpected_status_maps_to_unknown_error():
     client = _make_client(
-        _FakeResponse(status=500, json_error=_JsonMustNotBeCalledError())
+        _FakeResponse(status=500, read_error=_BodyMustNotBeReadError())
     )
 
     with pytest.raises(BoostyAPIUnknownError):
@@ -104,16 +105,13 @@ async def test_unexpected_status_maps_to_unknown_error():
 
 
 @pytest.mark.parametrize(
-    'parse_error',
-    [
-        ContentTypeError(cast('RequestInfo', None), ()),
-        json.JSONDecodeError('Expecting value', '<html></html>', 0),
-    ],
-    ids=['wrong_content_type', 'broken_json_body'],
+    'raw_body',
+    [b'<html></html>', b'{"data": [', b''],
+    ids=['html_page', 'broken_json_body', 'empty_body'],
 )
 @pytest.mark.asyncio
-async def test_200_with_non_json_body_maps_to_unknown_error(parse_error: Exception):
-    client = _make_client(_FakeResponse(status=200, json_error=parse_error))
+async def test_200_with_non_json_body_maps_to_unknown_error(raw_body: bytes):
+    client = _make_client(_FakeResponse(status=200, raw_body=raw_body))
 
     with pytest.raises(BoostyAPIUnknownError):
         await client.get_author_posts('any_author', limit=1)
@@ -164,6 +162,23 @@ async def test_broken_post_is_skipped_and_page_survives():
     assert response.skipped_posts[0].errors
 
 
+@pytest.mark.asyncio
+async def test_skipped_post_does_not_hold_on_to_the_raw_post():
+    broken_post = {'id': 'b1', 'title': 'broken'}
+    client = _make_client(
+        _FakeResponse(
+            status=200,
+            json_data={'data': [broken_post], 'extra': VALID_EXTRA},
+        )
+    )
+
+    response = await client.get_author_posts('any_author', limit=1)
+
+    errors = response.skipped_posts[0].errors
+    assert errors
+    assert all(error['input'] is not broken_post for error in errors)
+
+
 @pytest.mark.asyncio
 async def test_page_of_only_broken_posts_returns_empty_not_error():
     client = _make_client(
@@ -190,3 +205,13 @@ async def test_broken_pagination_still_fails_the_page():
 
     with pytest.raises(BoostyAPIValidationError):
         await client.get_author_posts('any_author', limit=1)
+
+
+@pytest.mark.asyncio
+async def test_page_without_posts_list_fails_as_validation_error():
+    client = _make_client(
+        _FakeResponse(status=200, json_data={'extra': VALID_EXTRA}),
+    )
+
+    with pytest.raises(BoostyAPIValidationError):
+        await client.get_author_posts('any_author', limit=1)
@@ -45,6 +45,19 @@ def test_known_chunk_with_broken_body_still_fails():
         CHUNK_ADAPTER.validate_python({'type': 'ok_video'})
 
 
+@pytest.mark.parametrize('tag', [['weird'], {'weird': 1}, 42])
+def test_non_string_chunk_type_is_a_validation_error(tag: object):
+    # Not a TypeError: the client skips broken posts by their ValidationError
+    with pytest.raises(ValidationError):
+        CHUNK_ADAPTER.validate_python({'type': tag})
+
+
+def test_absent_chunk_type_parses_as_unknown():
+    chunk = CHUNK_ADAPTER.validate_python({'payload': 1})
+
+    assert isinstance(chunk, BoostyPostDataUnknownDTO)
+
+
 def test_new_list_style_keeps_raw_word():
     list_chunk = BoostyPostDataListDTO.model_validate(
         {'type': 'list', 'items': [], 'style': 'checklist'}
@@ -0,0 +1,127 @@
+"""Tests for running download steps concurrently."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+import pytest
+
+from boosty_downloader.src.application.concurrency import gather_or_cancel, prefetch
+
+
+class _StepFailedError(Exception):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_results_keep_the_order_of_awaitables():
+    async def step(value: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return value
+
+    assert await gather_or_cancel(step(1, 0.02), step(2, 0), step(3, 0.01)) == [
+        1,
+        2,
+        3,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_siblings_and_waits_for_their_cleanup():
+    cleaned_up: list[str] = []
+
+    async def slow_download() -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned_up.append('partial file removed')
+
+    async def failing_download() -> None:
+        await asyncio.sleep(0)
+        raise _StepFailedError
+
+    with pytest.raises(_StepFailedError):
+        await gather_or_cancel(slow_download(), failing_download())
+
+    assert cleaned_up == ['partial file removed']
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fetches_next_item_while_current_is_processed():
+    fetched: list[int] = []
+
+    async def pages() -> AsyncIterator[int]:
+        for page in (1, 2, 3):
+            fetched.append(page)
+            yield page
+
+    processed: list[int] = []
+    async for page in prefetch(pages()):
+        await asyncio.sleep(0.01)  # Processing lets the producer run ahead
+        assert fetched[-1] >= min(page + 1, 3)
+        processed.append(page)
+
+    assert processed == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_reraises_source_error_after_earlier_items():
+    async def pages() -> AsyncIterator[int]:
+        yield 1
+        raise _StepFailedError
+
+    processed: list[int] = []
+
+    async def consume() -> None:
+        async for page in prefetch(pages()):
+            processed.append(page)  # noqa: PERF401
+
+    with pytest.raises(_StepFailedError):
+        await consume()
+
+    assert processed == [1]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fetches_at_most_size_items_ahead():
+    fetched: list[int] = []
+
+    async def pages() -> AsyncIterator[int]:
+        for page in range(1, 10):
+            fetched.append(page)
+            yield page
+
+    async with aclosing(prefetch(pages(), size=2)) as prefetched:
+        async for page in prefetched:
+            await asyncio.sleep(0.01)  # Give the producer time to run ahead
+            assert fetched[-1] <= page + 2
+            if page == 3:
+                break
+
+
+@pytest.mark.asyncio
+async def test_leaving_the_loop_stops_fetching():
+    fetched: list[int] = []
+    stopped: list[bool] = []
+
+    async def pages() -> AsyncIterator[int]:
+        page = 0
+        try:
+            while True:
+                page += 1
+                fetched.append(page)
+                await asyncio.sleep(0.001)  # Like waiting for an API response
+                yield page
+        finally:
+            stopped.append(True)
+
+    async with aclosing(prefetch(pages())) as prefetched:
+        async for page in prefetched:
+            if page == 2:
+                break
+
+    fetched_when_closed = len(fetched)
+    await asyncio.sleep(0.05)
+
+    assert stopped == [True]
+    assert len(fetched) == fetched_when_closed
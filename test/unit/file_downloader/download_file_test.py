@@ -0,0 +1,96 @@
+"""Tests for downloading a file to disk."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from boosty_downloader.src.infrastructure.file_downloader import (
+    DownloadFileConfig,
+    download_file,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from aiohttp_retry import RetryClient
+
+BODY = b'0123456789'
+
+
+class _FakeContent:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self.was_read = False
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        self.was_read = True
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class _FakeResponse:
+    status = 200
+    reason = 'OK'
+    content_type = 'application/octet-stream'
+
+    def __init__(self, body: bytes) -> None:
+        self.content_length = len(body)
+        self.content = _FakeContent(body)
+
+    async def __aenter__(self) -> _FakeResponse:  # noqa: PYI034
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        del args
+
+
+class _FakeSession:
+    def __init__(self, body: bytes) -> None:
+        self.response = _FakeResponse(body)
+
+    def get(self, url: str) -> _FakeResponse:
+        del url
+        return self.response
+
+
+def _config(session: _FakeSession, destination: Path) -> DownloadFileConfig:
+    return DownloadFileConfig(
+        session=cast('RetryClient', session),
+        url='https://example.com/file.bin',
+        filename='file.bin',
+        destination=destination,
+        guess_extension=False,
+        chunk_size_bytes=4,
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_is_written_in_chunks(tmp_path: Path):
+    path = await download_file(_config(_FakeSession(BODY), tmp_path))
+
+    assert path.read_bytes() == BODY
+
+
+@pytest.mark.asyncio
+async def test_complete_file_from_earlier_run_is_not_fetched_again(tmp_path: Path):
+    (tmp_path / 'file.bin').write_bytes(BODY)
+    session = _FakeSession(BODY)
+
+    path = await download_file(_config(session, tmp_path))
+
+    assert path.read_bytes() == BODY
+    assert not session.response.content.was_read
+
+
+@pytest.mark.asyncio
+async def test_partial_file_from_earlier_run_is_downloaded_again(tmp_path: Path):
+    (tmp_path / 'file.bin').write_bytes(BODY[:3])
+    session = _FakeSession(BODY)
+
+    path = await download_file(_config(session, tmp_path))
+
+    assert path.read_bytes() == BODY
+    assert session.response.content.was_read
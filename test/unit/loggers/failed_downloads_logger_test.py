@@ -0,0 +1,40 @@
+"""Tests for the deduplicating failed downloads log."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from boosty_downloader.src.infrastructure.loggers.failed_downloads_logger import (
+    FailedDownloadsLogger,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.asyncio
+async def test_same_error_is_written_once(tmp_path: Path):
+    log_file = tmp_path / 'failed.log'
+    logger = FailedDownloadsLogger(log_file)
+
+    await logger.add_error('post-1', 'first')
+    await logger.add_error('post-1', 'second')
+
+    assert log_file.read_text(encoding='utf-8') == '[post-1]: first\n'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_failures_do_not_duplicate_lines(tmp_path: Path):
+    log_file = tmp_path / 'failed.log'
+    log_file.write_text('[old]: from the previous run\n', encoding='utf-8')
+    logger = FailedDownloadsLogger(log_file)
+
+    await asyncio.gather(
+        *(logger.add_error(error_id, 'boom') for error_id in ['a', 'b', 'a', 'old'])
+    )
+
+    lines = log_file.read_text(encoding='utf-8').splitlines()
+    assert sorted(lines) == ['[a]: boom', '[b]: boom', '[old]: from the previous run']
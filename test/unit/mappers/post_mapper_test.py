@@ -11,6 +11,7 @@ from boosty_downloader.src.application.mappers.post_mapper import (
 from boosty_downloader.src.infrastructure.boosty_api.models.post.post import PostDTO
 from boosty_downloader.src.infrastructure.boosty_api.models.unknown_content import (
     UnknownContent,
+    collect_unknown_content,
 )
 
 if TYPE_CHECKING:
@@ -117,6 +118,19 @@ def test_incomplete_ok_video_with_null_upload_status():
     assert DownloadContentTypeFilter.boosty_videos in result.incomplete_content_types
 
 
+def test_ok_video_without_playable_url_is_counted():
+    video = _make_ok_video(complete=True, upload_status='ok')
+    video.player_urls = [BoostyOkVideoUrl(type=BoostyOkVideoType.medium, url='')]
+    post_dto = _make_post_dto([video])
+    result = map_post_dto_to_domain(
+        post_dto, preferred_video_quality=BoostyOkVideoType.medium
+    )
+
+    assert len(result.post.post_data_chunks) == 0
+    assert result.unplayable_videos == 1
+    assert not result.incomplete_content_types
+
+
 def test_complete_audio_is_mapped():
     post_dto = _make_post_dto([_make_audio(complete=True)])
     result = map_post_dto_to_domain(
@@ -169,7 +183,7 @@ def test_unknown_chunk_is_skipped_and_counted():
     )
 
     assert result.post.post_data_chunks == []
-    assert result.unknown_content == {
+    assert collect_unknown_content(post_dto) == {
         UnknownContent(path='data[0].type', raw='super_new_thing')
     }
 
@@ -190,12 +204,13 @@ def test_unknown_video_url_type_is_reported_not_fatal():
         ],
     )
 
+    post_dto = _make_post_dto([video])
     result = map_post_dto_to_domain(
-        _make_post_dto([video]), preferred_video_quality=BoostyOkVideoType.medium
+        post_dto, preferred_video_quality=BoostyOkVideoType.medium
     )
 
     assert len(result.post.post_data_chunks) == 1
-    assert result.unknown_content == {
+    assert collect_unknown_content(post_dto) == {
         UnknownContent(path='data[0].playerUrls[0].type', raw='ondemand_dash')
     }
 
@@ -209,12 +224,13 @@ def test_list_with_unknown_style_keeps_its_items():
         }
     )
 
+    post_dto = _make_post_dto([list_chunk])
     result = map_post_dto_to_domain(
-        _make_post_dto([list_chunk]), preferred_video_quality=BoostyOkVideoType.medium
+        post_dto, preferred_video_quality=BoostyOkVideoType.medium
     )
 
     assert len(result.post.post_data_chunks) == 1
-    assert result.unknown_content == {
+    assert collect_unknown_content(post_dto) == {
         UnknownContent(path='data[0].style', raw='checklist')
     }
 
@@ -234,11 +250,12 @@ def test_non_text_list_item_is_reported_not_silent():
         }
     )
 
+    post_dto = _make_post_dto([list_chunk])
     result = map_post_dto_to_domain(
-        _make_post_dto([list_chunk]), preferred_video_quality=BoostyOkVideoType.medium
+        post_dto, preferred_video_quality=BoostyOkVideoType.medium
     )
 
     assert len(result.post.post_data_chunks) == 1
-    assert result.unknown_content == {
+    assert collect_unknown_content(post_dto) == {
         UnknownContent(path='data[0].items[1].items[0].data[0].type', raw='image')
     }
@@ -0,0 +1,107 @@
+"""Tests for the SQLite post cache: what's missing, what's cached, how it's queried."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from sqlalchemy import event
+
+from boosty_downloader.src.application.filtering import DownloadContentTypeFilter
+from boosty_downloader.src.infrastructure.post_caching.post_cache import (
+    SQLitePostCache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from boosty_downloader.src.infrastructure.loggers.base import RichLogger
+
+UPDATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+ALL_PARTS = [
+    DownloadContentTypeFilter.post_content,
+    DownloadContentTypeFilter.files,
+]
+
+
+class _SilentLogger:
+    def error(self, msg: str) -> None:
+        del msg
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[SQLitePostCache]:
+    post_cache = SQLitePostCache(tmp_path, cast('RichLogger', _SilentLogger()))
+    yield post_cache
+    post_cache.close()
+
+
+def _count_queries(post_cache: SQLitePostCache) -> list[str]:
+    statements: list[str] = []
+
+    def _record(*args: object) -> None:
+        statements.append(cast('str', args[2]))
+
+    event.listen(post_cache._engine, 'before_cursor_execute', _record)  # noqa: SLF001
+    return statements
+
+
+def test_unknown_post_misses_everything(cache: SQLitePostCache):
+    assert cache.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == ALL_PARTS
+
+
+def test_cached_post_misses_only_parts_not_downloaded(cache: SQLitePostCache):
+    cache.cache_post('p1', UPDATED_AT, [DownloadContentTypeFilter.files])
+    cache.commit()
+
+    assert cache.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == [
+        DownloadContentTypeFilter.post_content
+    ]
+
+
+def test_updated_post_misses_everything_again(cache: SQLitePostCache):
+    cache.cache_post('p1', UPDATED_AT, ALL_PARTS)
+    cache.commit()
+
+    newer = UPDATED_AT + timedelta(hours=1)
+    assert cache.get_post_missing_parts('p1', newer, ALL_PARTS) == ALL_PARTS
+
+
+def test_prefetched_page_is_answered_without_queries(cache: SQLitePostCache):
+    cache.cache_post('p1', UPDATED_AT, ALL_PARTS)
+    cache.commit()
+
+    cache.prefetch(['p1', 'p2'])
+    statements = _count_queries(cache)
+
+    assert cache.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == []
+    assert cache.get_post_missing_parts('p2', UPDATED_AT, ALL_PARTS) == ALL_PARTS
+    assert statements == []
+
+
+def test_post_cached_after_prefetch_is_seen(cache: SQLitePostCache):
+    cache.prefetch(['p1'])
+    cache.cache_post('p1', UPDATED_AT, ALL_PARTS)
+
+    assert cache.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == []
+
+
+def test_fresh_cache_issues_no_queries(cache: SQLitePostCache):
+    statements = _count_queries(cache)
+
+    cache.prefetch(['p1', 'p2'])
+    assert cache.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == ALL_PARTS
+    assert cache.get_post_missing_parts('p3', UPDATED_AT, ALL_PARTS) == ALL_PARTS
+    assert statements == []
+
+
+def test_reopened_cache_finds_committed_posts(tmp_path: Path):
+    logger = cast('RichLogger', _SilentLogger())
+    with SQLitePostCache(tmp_path, logger) as first_run:
+        first_run.cache_post('p1', UPDATED_AT, ALL_PARTS)
+
+    with SQLitePostCache(tmp_path, logger) as second_run:
+        second_run.prefetch(['p1'])
+        assert second_run.get_post_missing_parts('p1', UPDATED_AT, ALL_PARTS) == []
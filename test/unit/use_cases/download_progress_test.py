@@ -0,0 +1,97 @@
+"""Tests for throttled download progress reporting."""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, cast
+
+from boosty_downloader.src.application.use_cases.download_single_post import (
+    _DownloadProgress,
+)
+from boosty_downloader.src.infrastructure.external_videos_downloader.external_videos_downloader import (
+    ExternalVideoDownloadStatus,
+)
+from boosty_downloader.src.infrastructure.file_downloader import DownloadingStatus
+
+if TYPE_CHECKING:
+    from boosty_downloader.src.cli.console_progress_reporter import ProgressReporter
+
+
+class _FakeReporter:
+    def __init__(self) -> None:
+        self.advances: list[int] = []
+        self.descriptions: list[str] = []
+
+    def update_task(
+        self, task_uuid: uuid.UUID, advance: int, description: str, **kwargs: object
+    ) -> None:
+        del task_uuid, kwargs
+        self.advances.append(advance)
+        self.descriptions.append(description)
+
+
+def test_updates_are_throttled_without_losing_bytes():
+    reporter = _FakeReporter()
+    progress = _DownloadProgress(
+        cast('ProgressReporter', reporter), uuid.uuid4(), 'File: a.bin'
+    )
+
+    for downloaded in range(10, 101, 10):
+        progress.on_file_status(
+            DownloadingStatus(
+                name='a.bin',
+                total_bytes=100,
+                total_downloaded_bytes=downloaded,
+                downloaded_bytes=10,
+            )
+        )
+
+    # The first chunk and the finished download are shown, the rest is batched
+    assert reporter.advances == [10, 90]
+
+
+def test_description_follows_a_changing_total():
+    reporter = _FakeReporter()
+    progress = _DownloadProgress(
+        cast('ProgressReporter', reporter), uuid.uuid4(), 'Video'
+    )
+
+    # yt-dlp refines its size estimate while downloading
+    for total in (2048, 4096):
+        progress.on_external_video_status(
+            ExternalVideoDownloadStatus(
+                name='v.mp4',
+                total_bytes=total,
+                downloaded_bytes=total,
+                speed=None,
+                percentage=100.0,
+                delta_bytes=1024,
+            )
+        )
+
+    assert reporter.descriptions == [
+        'Video [2.00 KB / 2.00 KB]',
+        'Video [4.00 KB / 4.00 KB]',
+    ]
+
+
+def test_flush_reports_bytes_held_back_without_a_known_total():
+    reporter = _FakeReporter()
+    progress = _DownloadProgress(
+        cast('ProgressReporter', reporter), uuid.uuid4(), 'File: a.bin'
+    )
+
+    for downloaded in (10, 20, 30):
+        progress.on_file_status(
+            DownloadingStatus(
+                name='a.bin',
+                total_bytes=None,
+                total_downloaded_bytes=downloaded,
+                downloaded_bytes=10,
+            )
+        )
+    progress.flush()
+    progress.flush()  # Nothing left: no extra update
+
+    assert reporter.advances == [10, 20]
+    assert reporter.descriptions[-1] == 'File: a.bin [30.00 B / N/A]'
@@ -0,0 +1,354 @@
+"""Tests for downloading a single post."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from boosty_downloader.src.application.filtering import DownloadContentTypeFilter
+from boosty_downloader.src.application.use_cases import download_single_post
+from boosty_downloader.src.application.use_cases.download_single_post import (
+    DownloadSinglePostUseCase,
+)
+from boosty_downloader.src.domain.post_data_chunks import PostDataChunkExternalVideo
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post import PostDTO
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types.post_data_file import (
+    BoostyPostDataFileDTO,
+)
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types.post_data_image import (
+    BoostyPostDataImageDTO,
+)
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types.post_data_ok_video import (
+    BoostyOkVideoType,
+    BoostyOkVideoUrl,
+    BoostyPostDataOkVideoDTO,
+)
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post_data_types.post_data_text import (
+    BoostyPostDataTextDTO,
+)
+from boosty_downloader.src.infrastructure.external_videos_downloader.external_videos_downloader import (
+    ExtVideoInterruptedByUserError,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from boosty_downloader.src.application.di.download_context import (
+        DownloadContext,
+    )
+    from boosty_downloader.src.domain.post_data_chunks import PostDataChunkImage
+    from boosty_downloader.src.infrastructure.boosty_api.models.post.base_post_data import (
+        BasePostData,
+    )
+    from boosty_downloader.src.infrastructure.html_generator.models import (
+        HtmlGenChunk,
+        HtmlGenImage,
+    )
+
+
+class _ChunkFailedError(Exception):
+    pass
+
+
+class _FakeReporter:
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+
+    def warn(self, message: str) -> None:
+        self.warnings.append(message)
+
+    def notice(self, message: str) -> None:
+        del message
+
+    def success(self, message: str) -> None:
+        del message
+
+    def create_task(self, *args: object, **kwargs: object) -> uuid.UUID:
+        del args, kwargs
+        return uuid.uuid4()
+
+    def update_task(self, *args: object, **kwargs: object) -> None:
+        del args, kwargs
+
+    def complete_task(self, task_uuid: uuid.UUID) -> None:
+        del task_uuid
+
+
+class _UncachedPosts:
+    def get_post_missing_parts(
+        self, *, required: list[DownloadContentTypeFilter], **kwargs: object
+    ) -> list[DownloadContentTypeFilter]:
+        del kwargs
+        return required
+
+    def cache_post(self, *args: object) -> None:
+        del args
+
+
+def _make_use_case(
+    destination: Path,
+    data: list[BasePostData],
+    filters: list[DownloadContentTypeFilter],
+    reporter: _FakeReporter | None = None,
+) -> DownloadSinglePostUseCase:
+    post_dto = PostDTO(
+        id='test-uuid-1234',
+        title='Test Post',
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        has_access=True,
+        signed_query='sig=abc',
+        data=data,
+    )
+    context = cast(
+        'DownloadContext',
+        SimpleNamespace(
+            progress_reporter=reporter or _FakeReporter(),
+            post_cache=_UncachedPosts(),
+            filters=filters,
+            preferred_video_quality=BoostyOkVideoType.medium,
+        ),
+    )
+    return DownloadSinglePostUseCase(
+        destination=destination, post_dto=post_dto, download_context=context
+    )
+
+
+def _make_text(text: str) -> BoostyPostDataTextDTO:
+    return BoostyPostDataTextDTO(
+        type='text', content=f'["{text}", "unstyled", []]', modificator=''
+    )
+
+
+async def _warnings_for(
+    tmp_path: Path, filters: list[DownloadContentTypeFilter]
+) -> list[str]:
+    video = BoostyPostDataOkVideoDTO(
+        type='ok_video',
+        title='test video',
+        failover_host='https://example.com',
+        duration=timedelta(seconds=120),
+        upload_status='ok',
+        complete=True,
+        player_urls=[BoostyOkVideoUrl(type=BoostyOkVideoType.medium, url='')],
+    )
+    reporter = _FakeReporter()
+    await _make_use_case(tmp_path, [video], filters, reporter).execute()
+    return reporter.warnings
+
+
+@pytest.mark.asyncio
+async def test_unplayable_video_is_reported_when_videos_are_requested(
+    tmp_path: Path,
+):
+    warnings = await _warnings_for(tmp_path, [DownloadContentTypeFilter.boosty_videos])
+
+    assert len(warnings) == 1
+    assert 'without a playable URL' in warnings[0]
+
+
+@pytest.mark.asyncio
+async def test_unplayable_video_is_not_reported_for_other_filters(tmp_path: Path):
+    warnings = await _warnings_for(
+        tmp_path,
+        [DownloadContentTypeFilter.files, DownloadContentTypeFilter.post_content],
+    )
+
+    assert warnings == []
+
+
+class _BlockingVideosDownloader:
+    """Stands in for yt-dlp: runs until it is told to stop."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def download_video(
+        self, *, cancel_event: threading.Event, **kwargs: object
+    ) -> Path:
+        del kwargs
+        self.started.set()
+        try:
+            cancel_event.wait(timeout=5)
+            raise ExtVideoInterruptedByUserError
+        finally:
+            self.stopped.set()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_external_video_waits_for_the_worker_to_stop(
+    tmp_path: Path,
+):
+    downloader = _BlockingVideosDownloader()
+    context = cast(
+        'DownloadContext',
+        SimpleNamespace(
+            progress_reporter=_FakeReporter(), external_videos_downloader=downloader
+        ),
+    )
+    use_case = DownloadSinglePostUseCase(
+        destination=tmp_path,
+        post_dto=cast('PostDTO', None),
+        download_context=context,
+    )
+
+    task = asyncio.ensure_future(
+        use_case.download_external_videos(
+            PostDataChunkExternalVideo(url='https://example.com/v')
+        )
+    )
+    await asyncio.to_thread(downloader.started.wait, 5)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Stopped before the cancellation propagated, not later in the background
+    assert downloader.stopped.is_set()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_rendering_leaves_no_post_html(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow_render(chunks: list[HtmlGenChunk], out_path: Path) -> None:
+        del chunks
+        started.set()
+        time.sleep(0.1)
+        out_path.write_text('<html>', encoding='utf-8')
+        finished.set()
+
+    monkeypatch.setattr(download_single_post, 'render_html_to_file', slow_render)
+    use_case = _make_use_case(
+        tmp_path, [_make_text('Hello')], [DownloadContentTypeFilter.post_content]
+    )
+
+    task = asyncio.ensure_future(use_case.execute())
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The write finished before the cleanup, not after it
+    assert finished.is_set()
+    assert not use_case.post_file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_post_with_only_files_writes_no_post_html(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    use_case = _make_use_case(
+        tmp_path,
+        [
+            BoostyPostDataFileDTO(
+                type='file', url='https://example.com/f', title='a.zip'
+            )
+        ],
+        [DownloadContentTypeFilter.files, DownloadContentTypeFilter.post_content],
+    )
+
+    async def fake_download_files(file: object) -> Path:
+        del file
+        return use_case.files_destination / 'a.zip'
+
+    monkeypatch.setattr(use_case, 'download_files', fake_download_files)
+    await use_case.execute()
+
+    assert not use_case.post_file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_post_with_text_writes_post_html(tmp_path: Path):
+    use_case = _make_use_case(
+        tmp_path, [_make_text('Hello')], [DownloadContentTypeFilter.post_content]
+    )
+
+    await use_case.execute()
+
+    assert 'Hello' in use_case.post_file_path.read_text(encoding='utf-8')
+
+
+def _make_images(*names: str) -> list[BasePostData]:
+    return [
+        BoostyPostDataImageDTO(type='image', url=f'https://example.com/{name}')
+        for name in names
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chunks_finishing_out_of_order_render_in_post_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    rendered: list[HtmlGenChunk] = []
+    monkeypatch.setattr(
+        download_single_post,
+        'render_html_to_file',
+        lambda chunks, out_path: rendered.extend(chunks),  # noqa: ARG005
+    )
+    use_case = _make_use_case(
+        tmp_path,
+        _make_images('slow.png', 'fast.png', 'medium.png'),
+        [DownloadContentTypeFilter.post_content],
+    )
+    delays = {'slow.png': 0.03, 'fast.png': 0, 'medium.png': 0.01}
+    finished: list[str] = []
+
+    async def fake_download_image(image: PostDataChunkImage) -> Path:
+        name = image.url.rsplit('/', 1)[-1]
+        await asyncio.sleep(delays[name])
+        finished.append(name)
+        return use_case.images_destination / name
+
+    monkeypatch.setattr(use_case, 'download_image', fake_download_image)
+    await use_case.execute()
+
+    assert finished == ['fast.png', 'medium.png', 'slow.png']
+    assert [cast('HtmlGenImage', chunk).alt for chunk in rendered] == [
+        'slow.png',
+        'fast.png',
+        'medium.png',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_chunk_cancels_the_other_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    use_case = _make_use_case(
+        tmp_path,
+        _make_images('broken.png', 'slow.png'),
+        [DownloadContentTypeFilter.post_content],
+    )
+    cancelled: list[str] = []
+
+    async def fake_download_image(image: PostDataChunkImage) -> Path:
+        if image.url.endswith('broken.png'):
+            await asyncio.sleep(0)
+            raise _ChunkFailedError
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append('slow.png')
+            raise
+        return use_case.images_destination / 'slow.png'
+
+    monkeypatch.setattr(use_case, 'download_image', fake_download_image)
+
+    with pytest.raises(_ChunkFailedError):
+        await asyncio.wait_for(use_case.execute(), timeout=5)
+
+    assert cancelled == ['slow.png']
+    assert not use_case.post_file_path.exists()
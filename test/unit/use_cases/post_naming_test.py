@@ -0,0 +1,26 @@
+"""Tests for the names posts are saved under."""
+
+from datetime import datetime, timezone
+
+from boosty_downloader.src.application.post_naming import sanitized_post_title
+from boosty_downloader.src.infrastructure.boosty_api.models.post.post import PostDTO
+
+
+def _make_post(title: str) -> PostDTO:
+    return PostDTO(
+        id='0123456789abcdef',
+        title=title,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        has_access=True,
+        signed_query='',
+        data=[],
+    )
+
+
+def test_unsafe_characters_and_dots_are_removed():
+    assert sanitized_post_title(_make_post(' Part 1: a/b... ')) == 'Part 1 ab'
+
+
+def test_empty_title_falls_back_to_post_id():
+    assert sanitized_post_title(_make_post('')) == 'No title (id_01234567)'